@@ -23,14 +23,13 @@ if TYPE_CHECKING:
     from aws_advanced_python_wrapper.hostinfo import HostInfo
     from aws_advanced_python_wrapper.utils.properties import Properties
 
-from logging import getLogger
 from time import perf_counter_ns
 from typing import Callable, Set
 
 from aws_advanced_python_wrapper.plugin import Plugin, PluginFactory
-from aws_advanced_python_wrapper.utils.messages import Messages
+from aws_advanced_python_wrapper.utils.log import Logger
 
-logger = getLogger(__name__)
+logger = Logger(__name__)
 
 
 class ConnectTimePlugin(Plugin):
@@ -59,7 +58,7 @@ class ConnectTimePlugin(Plugin):
         elapsed_time_ns = perf_counter_ns() - start_time_ns
         ConnectTimePlugin.connect_time += elapsed_time_ns
 
-        logger.debug(Messages.get_formatted("ConnectTimePlugin.ConnectTime", elapsed_time_ns))
+        logger.debug("ConnectTimePlugin.ConnectTime", elapsed_time_ns)
 
         return result
 
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from aws_advanced_python_wrapper.database_dialect import DatabaseDialect
 
 from typing import Optional, Protocol
+from weakref import WeakKeyDictionary
 
 
 class ExceptionHandler(Protocol):
@@ -42,32 +43,58 @@ class ExceptionHandler(Protocol):
         pass
 
 
+# Kept at module level so handler resolution is a single global lookup rather than an instance and class lookup.
+_custom_handler: Optional[ExceptionHandler] = None
+# Resolved handler per dialect instance, so the dialect's exception_handler property is only evaluated once.
+_dialect_handlers: WeakKeyDictionary[DatabaseDialect, ExceptionHandler] = WeakKeyDictionary()
+
+
+def _resolve_dialect_handler(dialect: DatabaseDialect) -> Optional[ExceptionHandler]:
+    handler = dialect.exception_handler
+    if handler is not None:
+        _dialect_handlers[dialect] = handler
+    return handler
+
+
 class ExceptionManager:
-    custom_handler: Optional[ExceptionHandler] = None
+    @staticmethod
+    def get_custom_handler() -> Optional[ExceptionHandler]:
+        return _custom_handler
 
     @staticmethod
     def set_custom_handler(handler: ExceptionHandler):
-        ExceptionManager.custom_handler = handler
+        global _custom_handler
+        _custom_handler = handler
+        _dialect_handlers.clear()
 
     @staticmethod
     def reset_custom_handler():
-        ExceptionManager.custom_handler = None
+        global _custom_handler
+        _custom_handler = None
+        _dialect_handlers.clear()
 
     def is_network_exception(self, dialect: Optional[DatabaseDialect], error: Optional[Exception] = None,
                              sql_state: Optional[str] = None) -> bool:
-        handler = self._get_handler(dialect)
+        if dialect is None:
+            return False
+        handler = _custom_handler
+        if handler is None:
+            handler = _dialect_handlers.get(dialect)
+            if handler is None:
+                handler = _resolve_dialect_handler(dialect)
         if handler is not None:
-            return handler.is_network_exception(error=error, sql_state=sql_state)
+            return handler.is_network_exception(error, sql_state)
         return False
 
     def is_login_exception(self, dialect: Optional[DatabaseDialect], error: Optional[Exception] = None,
                            sql_state: Optional[str] = None) -> bool:
-        handler = self._get_handler(dialect)
+        if dialect is None:
+            return False
+        handler = _custom_handler
+        if handler is None:
+            handler = _dialect_handlers.get(dialect)
+            if handler is None:
+                handler = _resolve_dialect_handler(dialect)
         if handler is not None:
-            return handler.is_login_exception(error=error, sql_state=sql_state)
+            return handler.is_login_exception(error, sql_state)
         return False
-
-    def _get_handler(self, dialect: Optional[DatabaseDialect]) -> Optional[ExceptionHandler]:
-        if dialect is None:
-            return None
-        return self.custom_handler if self.custom_handler else dialect.exception_handler
@@ -31,7 +31,8 @@ from aws_advanced_python_wrapper.errors import (
     TransactionResolutionUnknownError)
 from aws_advanced_python_wrapper.host_availability import HostAvailability
 from aws_advanced_python_wrapper.hostinfo import HostInfo, HostRole
-from aws_advanced_python_wrapper.plugin import Plugin, PluginFactory
+from aws_advanced_python_wrapper.plugin import (CanReleaseResources, Plugin,
+                                                PluginFactory)
 from aws_advanced_python_wrapper.reader_failover_handler import (
     ReaderFailoverHandler, ReaderFailoverHandlerImpl)
 from aws_advanced_python_wrapper.stale_dns_plugin import StaleDnsHelper
@@ -52,7 +53,7 @@ from aws_advanced_python_wrapper.writer_failover_handler import (
 logger = Logger(__name__)
 
 
-class FailoverPlugin(Plugin):
+class FailoverPlugin(Plugin, CanReleaseResources):
     """
     This plugin provides cluster-aware failover features.
     The plugin switches connections upon detecting communication related exceptions and/or cluster topology changes.
@@ -114,6 +115,11 @@ class FailoverPlugin(Plugin):
 
         FailoverPlugin._SUBSCRIBED_METHODS.update(self._plugin_service.network_bound_methods)
 
+    def release_resources(self):
+        # The handlers are only created when failover is enabled
+        if hasattr(self, "_reader_failover_handler"):
+            self._reader_failover_handler.close()
+
     def init_host_provider(
             self,
             properties: Properties,
@@ -26,6 +26,8 @@ from typing import Optional
 
 @dataclass
 class ReaderFailoverResult:
+    __slots__ = ("connection", "is_connected", "new_host", "exception")
+
     connection: Optional[Connection]
     is_connected: bool
     new_host: Optional[HostInfo]
@@ -19,21 +19,24 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from aws_advanced_python_wrapper.driver_dialect import DriverDialect
     from aws_advanced_python_wrapper.hostinfo import HostInfo
-    from aws_advanced_python_wrapper.pep249 import Connection
+    from aws_advanced_python_wrapper.pep249 import Connection, Cursor
     from aws_advanced_python_wrapper.plugin_service import PluginService
+    from aws_advanced_python_wrapper.utils.rds_url_type import RdsUrlType
 
-from concurrent.futures import (Executor, Future, ThreadPoolExecutor,
-                                TimeoutError)
-from copy import copy
+from collections import deque
+from concurrent.futures import TimeoutError
 from dataclasses import dataclass
-from queue import Queue
-from threading import Event, Lock, RLock
-from time import perf_counter_ns, sleep
-from typing import Any, Callable, ClassVar, Dict, FrozenSet, Optional, Set
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import Event, Lock, RLock, Thread
+from time import perf_counter_ns
+from typing import (Any, Callable, ClassVar, Deque, Dict, FrozenSet, Iterator,
+                    List, Optional, Set, Tuple)
 
 from _weakref import ReferenceType, ref
 
-from aws_advanced_python_wrapper.errors import AwsWrapperError
+from aws_advanced_python_wrapper.errors import (AwsWrapperError,
+                                                QueryTimeoutError)
 from aws_advanced_python_wrapper.host_availability import HostAvailability
 from aws_advanced_python_wrapper.plugin import (CanReleaseResources, Plugin,
                                                 PluginFactory)
@@ -47,7 +50,6 @@ from aws_advanced_python_wrapper.utils.properties import (Properties,
 from aws_advanced_python_wrapper.utils.rdsutils import RdsUtils
 from aws_advanced_python_wrapper.utils.telemetry.telemetry import (
     TelemetryCounter, TelemetryTraceLevel)
-from aws_advanced_python_wrapper.utils.utils import QueueUtils
 
 logger = Logger(__name__)
 
@@ -59,6 +61,12 @@ class HostMonitoringPluginFactory(PluginFactory):
 
 class HostMonitoringPlugin(Plugin, CanReleaseResources):
     _SUBSCRIBED_METHODS: Set[str] = {"*"}
+    _RDS_TYPE_CACHE_MAX_SIZE: ClassVar[int] = 256
+    # Caches RdsUtils.identify_rds_type results per host; entries are evicted in insertion order once full.
+    _rds_type_cache: ClassVar[Dict[str, RdsUrlType]] = {}
+    # Guards updates to the cache, which is shared by every connecting thread. Lookups do not need it.
+    _rds_type_cache_lock: ClassVar[Lock] = Lock()
+    _rds_utils: ClassVar[RdsUtils] = RdsUtils()
 
     def __init__(self, plugin_service, props):
         dialect: DriverDialect = plugin_service.driver_dialect
@@ -70,9 +78,14 @@ class HostMonitoringPlugin(Plugin, CanReleaseResources):
         self._plugin_service: PluginService = plugin_service
         self._is_connection_initialized = False
         self._monitoring_host_info: Optional[HostInfo] = None
-        self._rds_utils: RdsUtils = RdsUtils()
         self._monitor_service: MonitorService = MonitorService(plugin_service)
-        self._lock: Lock = Lock()
+
+        # The monitoring settings are fixed for the lifetime of the plugin, so parse them once here
+        # instead of on every network-bound method call.
+        self._is_enabled: bool = WrapperProperties.FAILURE_DETECTION_ENABLED.get_bool(props)
+        self._failure_detection_time_ms: int = WrapperProperties.FAILURE_DETECTION_TIME_MS.get_int(props)
+        self._failure_detection_interval_ms: int = WrapperProperties.FAILURE_DETECTION_INTERVAL_MS.get_int(props)
+        self._failure_detection_count: int = WrapperProperties.FAILURE_DETECTION_COUNT.get_int(props)
 
     @property
     def subscribed_methods(self) -> Set[str]:
@@ -101,7 +114,7 @@ class HostMonitoringPlugin(Plugin, CanReleaseResources):
     def _connect(self, host_info: HostInfo, connect_func: Callable) -> Connection:
         conn = connect_func()
         if conn:
-            rds_type = self._rds_utils.identify_rds_type(host_info.host)
+            rds_type = self._identify_rds_type(host_info.host)
             if rds_type.is_rds_cluster:
                 host_info.reset_aliases()
                 self._plugin_service.fill_aliases(conn, host_info)
@@ -116,45 +129,39 @@ class HostMonitoringPlugin(Plugin, CanReleaseResources):
         if host_info is None:
             raise AwsWrapperError(Messages.get_formatted("HostMonitoringPlugin.HostInfoNoneForMethod", method_name))
 
-        is_enabled = WrapperProperties.FAILURE_DETECTION_ENABLED.get_bool(self._props)
-        if not is_enabled or not self._plugin_service.is_network_bound_method(method_name):
+        if not self._is_enabled or not self._plugin_service.is_network_bound_method(method_name):
             return execute_func()
 
-        failure_detection_time_ms = WrapperProperties.FAILURE_DETECTION_TIME_MS.get_int(self._props)
-        failure_detection_interval = WrapperProperties.FAILURE_DETECTION_INTERVAL_MS.get_int(self._props)
-        failure_detection_count = WrapperProperties.FAILURE_DETECTION_COUNT.get_int(self._props)
-
         monitor_context = None
         result = None
 
         try:
             logger.debug("HostMonitoringPlugin.ActivatedMonitoring", method_name)
+            monitoring_host_info = self._get_monitoring_host_info()
             monitor_context = self._monitor_service.start_monitoring(
                 connection,
-                self._get_monitoring_host_info().all_aliases,
-                self._get_monitoring_host_info(),
+                monitoring_host_info.all_aliases,
+                monitoring_host_info,
                 self._props,
-                failure_detection_time_ms,
-                failure_detection_interval,
-                failure_detection_count
+                self._failure_detection_time_ms,
+                self._failure_detection_interval_ms,
+                self._failure_detection_count
             )
             result = execute_func()
         finally:
             if monitor_context:
-                with self._lock:
-                    self._monitor_service.stop_monitoring(monitor_context)
-                    if monitor_context.is_host_unavailable():
-                        self._plugin_service.set_availability(
-                            self._get_monitoring_host_info().all_aliases, HostAvailability.UNAVAILABLE)
-
-                        driver_dialect = self._plugin_service.driver_dialect
-                        if driver_dialect is not None and not driver_dialect.is_closed(connection):
-                            try:
-                                connection.close()
-                            except Exception:
-                                pass
-                            raise AwsWrapperError(
-                                Messages.get_formatted("HostMonitoringPlugin.UnavailableHost", host_info.as_alias()))
+                self._monitor_service.stop_monitoring(monitor_context)
+                if monitor_context.is_host_unavailable():
+                    self._plugin_service.set_availability(monitoring_host_info.all_aliases, HostAvailability.UNAVAILABLE)
+
+                    driver_dialect = self._plugin_service.driver_dialect
+                    if driver_dialect is not None and not driver_dialect.is_closed(connection):
+                        try:
+                            connection.close()
+                        except Exception:
+                            pass
+                        raise AwsWrapperError(
+                            Messages.get_formatted("HostMonitoringPlugin.UnavailableHost", host_info.as_alias()))
                 logger.debug("HostMonitoringPlugin.MonitoringDeactivated", method_name)
 
         return result
@@ -187,7 +194,7 @@ class HostMonitoringPlugin(Plugin, CanReleaseResources):
             if current_host_info is None:
                 raise AwsWrapperError("HostMonitoringPlugin.HostInfoNone")
             self._monitoring_host_info = current_host_info
-            rds_type = self._rds_utils.identify_rds_type(self._monitoring_host_info.url)
+            rds_type = self._identify_rds_type(self._monitoring_host_info.url)
 
             try:
                 if rds_type.is_rds_cluster:
@@ -206,6 +213,17 @@ class HostMonitoringPlugin(Plugin, CanReleaseResources):
                 raise AwsWrapperError(Messages.get_formatted(message, e)) from e
         return self._monitoring_host_info
 
+    def _identify_rds_type(self, host: str) -> RdsUrlType:
+        cache = HostMonitoringPlugin._rds_type_cache
+        rds_type = cache.get(host)
+        if rds_type is None:
+            rds_type = self._rds_utils.identify_rds_type(host)
+            with HostMonitoringPlugin._rds_type_cache_lock:
+                if host not in cache and len(cache) >= HostMonitoringPlugin._RDS_TYPE_CACHE_MAX_SIZE:
+                    cache.pop(next(iter(cache)), None)
+                cache[host] = rds_type
+        return rds_type
+
     def release_resources(self):
         if self._monitor_service is not None:
             self._monitor_service.release_resources()
@@ -219,6 +237,24 @@ class MonitoringContext:
     This contains each connection's criteria for whether a server should be considered unhealthy.
     The context is shared between the main thread and the monitor thread.
     """
+    # A context is created for every monitored method call, so avoid a per-instance __dict__
+    __slots__ = (
+        "_monitor",
+        "_connection",
+        "_target_dialect",
+        "_failure_detection_time_ms",
+        "_failure_detection_interval_ms",
+        "_failure_detection_count",
+        "_failure_detection_time_ns",
+        "_max_unavailable_host_duration_ns",
+        "_aborted_connections_counter",
+        "_monitor_start_time_ns",
+        "_active_monitoring_start_time_ns",
+        "_unavailable_host_start_time_ns",
+        "_current_failure_count",
+        "_is_host_unavailable",
+        "_is_active")
+
     def __init__(
             self,
             monitor: Monitor,
@@ -234,6 +270,9 @@ class MonitoringContext:
         self._failure_detection_time_ms: int = failure_detection_time_ms
         self._failure_detection_interval_ms: int = failure_detection_interval_ms
         self._failure_detection_count: int = failure_detection_count
+        self._failure_detection_time_ns: int = failure_detection_time_ms * 1_000_000
+        self._max_unavailable_host_duration_ns: int = \
+            failure_detection_interval_ms * max(0, failure_detection_count) * 1_000_000
         self._aborted_connections_counter = aborted_connections_counter
 
         self._monitor_start_time_ns: int = 0  # Time of monitor context submission
@@ -272,7 +311,7 @@ class MonitoringContext:
 
     def set_monitor_start_time_ns(self, start_time_ns: int):
         self._monitor_start_time_ns = start_time_ns
-        self._active_monitoring_start_time_ns = start_time_ns + self._failure_detection_time_ms * 1_000_000
+        self._active_monitoring_start_time_ns = start_time_ns + self._failure_detection_time_ns
 
     def _abort_connection(self):
         if self._connection is None or not self._is_active:
@@ -299,7 +338,7 @@ class MonitoringContext:
         if not self._is_active:
             return
         total_elapsed_time_ns = status_check_end_time_ns - self._monitor_start_time_ns
-        if total_elapsed_time_ns > (self._failure_detection_time_ms * 1_000_000):
+        if total_elapsed_time_ns > self._failure_detection_time_ns:
             self._set_host_availability(host, is_available, status_check_start_time_ns, status_check_end_time_ns)
 
     def _set_host_availability(
@@ -326,10 +365,8 @@ class MonitoringContext:
         if self._unavailable_host_start_time_ns <= 0:
             self._unavailable_host_start_time_ns = status_check_start_time_ns
         unavailable_host_duration_ns = status_check_end_time_ns - self._unavailable_host_start_time_ns
-        max_unavailable_host_duration_ms = \
-            self._failure_detection_interval_ms * max(0, self._failure_detection_count)
 
-        if unavailable_host_duration_ns > (max_unavailable_host_duration_ms * 1_000_000):
+        if unavailable_host_duration_ns > self._max_unavailable_host_duration_ns:
             logger.debug("MonitorContext.HostUnavailable", host)
             self._is_host_unavailable = True
             self._abort_connection()
@@ -360,14 +397,34 @@ class Monitor:
         self._plugin_service: PluginService = plugin_service
         self._host_info: HostInfo = host_info
         self._props: Properties = props
+        # The properties do not change during the monitor's lifetime, so the monitoring connection properties are
+        # only derived once.
+        self._monitoring_props: Properties = Monitor._get_monitoring_props(props)
         self._monitor_container: MonitoringThreadContainer = monitor_container
         self._telemetry_factory = self._plugin_service.get_telemetry_factory()
 
-        self._lock: Lock = Lock()
-        self._active_contexts: Queue[MonitoringContext] = Queue()
-        self._new_contexts: Queue[MonitoringContext] = Queue()
+        # deque append and popleft are thread-safe, and the monitor thread is the only consumer.
+        self._active_contexts: Deque[MonitoringContext] = deque()
+        # Min-heap of (active monitoring start time, insertion order, context) so that the monitor only visits the
+        # new contexts that are due. The insertion order breaks ties without comparing the contexts themselves.
+        self._new_contexts: List[Tuple[int, int, MonitoringContext]] = []
+        self._new_contexts_counter: Iterator[int] = count()
+        self._new_contexts_lock: Lock = Lock()
+        # The time up to which the new contexts have been moved to the active contexts. Contexts due after it are
+        # still in the heap.
+        self._new_contexts_due_ns: int = 0
+        # Number of contexts in the heap that were stopped before they became due. They are skipped when popped, and
+        # the heap is only compacted once they make up most of it.
+        self._stopped_new_contexts: int = 0
         self._monitoring_conn: Optional[Connection] = None
+        # Reused by every status check on the current monitoring connection
+        self._monitoring_cursor: Optional[Cursor] = None
         self._is_stopped: Event = Event()
+        # Set to cut the monitor's sleep short, either because it is being stopped or because new work has arrived.
+        self._wakeup: Event = Event()
+        # The time at which an idle monitor next wakes up to look for new contexts that are due. Zero while the
+        # monitor is active, as an active monitor picks up new contexts with its next host status check.
+        self._idle_wakeup_time_ns: int = 0
         self._monitor_disposal_time_ms: int = WrapperProperties.MONITOR_DISPOSAL_TIME_MS.get_int(props)
         self._context_last_used_ns: int = perf_counter_ns()
         self._host_check_timeout_ms: int = Monitor._MIN_HOST_CHECK_TIMEOUT_MS
@@ -378,6 +435,8 @@ class Monitor:
 
     @dataclass
     class HostStatus:
+        __slots__ = ("is_available", "elapsed_time_ns")
+
         is_available: bool
         elapsed_time_ns: int
 
@@ -387,24 +446,37 @@ class Monitor:
 
     def stop(self):
         self._is_stopped.set()
+        self._wakeup.set()
 
     def start_monitoring(self, context: MonitoringContext):
         current_time_ns = perf_counter_ns()
         context.set_monitor_start_time_ns(current_time_ns)
         self._context_last_used_ns = current_time_ns
-        self._new_contexts.put(context)
+        active_monitoring_start_time_ns = context.active_monitoring_start_time_ns
+        with self._new_contexts_lock:
+            heappush(
+                self._new_contexts,
+                (active_monitoring_start_time_ns, next(self._new_contexts_counter), context))
+            if active_monitoring_start_time_ns < self._idle_wakeup_time_ns:
+                # The context is due before the idle monitor would wake up by itself
+                self._wakeup.set()
 
     def stop_monitoring(self, context: MonitoringContext):
         if context is None:
             logger.warning("Monitor.ContextNone")
             return
 
-        context.is_active = False
+        with self._new_contexts_lock:
+            if context.is_active and context.active_monitoring_start_time_ns > self._new_contexts_due_ns:
+                self._stopped_new_contexts += 1
+            context.is_active = False
         self._context_last_used_ns = perf_counter_ns()
 
     def clear_contexts(self):
-        QueueUtils.clear(self._new_contexts)
-        QueueUtils.clear(self._active_contexts)
+        with self._new_contexts_lock:
+            self._new_contexts.clear()
+            self._stopped_new_contexts = 0
+        self._active_contexts.clear()
 
     def run(self):
         try:
@@ -412,76 +484,83 @@ class Monitor:
 
             while not self.is_stopped:
                 try:
+                    self._wakeup.clear()
                     current_time_ns = perf_counter_ns()
-                    first_added_new_context = None
-
-                    # Process new contexts
-                    while (new_monitor_context := QueueUtils.get(self._new_contexts)) is not None:
-                        if first_added_new_context == new_monitor_context:
-                            # This context has already been processed.
-                            # Add it back to the queue and process it in the next round.
-                            self._new_contexts.put(new_monitor_context)
-                            break
-
-                        if not new_monitor_context.is_active:
-                            # Discard inactive contexts
-                            continue
-
-                        if current_time_ns >= new_monitor_context.active_monitoring_start_time_ns:
-                            # Submit the context for active monitoring
-                            self._active_contexts.put(new_monitor_context)
-                            continue
-
-                        # The active monitoring start time has not been hit yet.
-                        # Add the context back to the queue and check it later.
-                        self._new_contexts.put(new_monitor_context)
-                        if first_added_new_context is None:
-                            first_added_new_context = new_monitor_context
 
-                    if self._active_contexts.empty():
-                        if (perf_counter_ns() - self._context_last_used_ns) >= self._monitor_disposal_time_ms * 1_000_000:
+                    # Process new contexts whose active monitoring start time has been hit.
+                    # The others stay in the heap until their start time is reached.
+                    with self._new_contexts_lock:
+                        # Drop the contexts stopped before they became due once they make up most of the heap,
+                        # rather than holding on to them and their connections until their active monitoring start
+                        # time.
+                        if self._stopped_new_contexts * 2 > len(self._new_contexts):
+                            self._new_contexts = [entry for entry in self._new_contexts if entry[2].is_active]
+                            heapify(self._new_contexts)
+                            self._stopped_new_contexts = 0
+
+                        while self._new_contexts and self._new_contexts[0][0] <= current_time_ns:
+                            new_monitor_context = heappop(self._new_contexts)[2]
+                            if new_monitor_context.is_active:
+                                # Submit the context for active monitoring
+                                self._active_contexts.append(new_monitor_context)
+                            elif self._stopped_new_contexts > 0:
+                                self._stopped_new_contexts -= 1
+                        self._new_contexts_due_ns = current_time_ns
+
+                        if self._active_contexts:
+                            idle_wakeup_time_ns = 0
+                        else:
+                            # Sleep until the next new context is due, checking for disposal at the usual interval
+                            idle_wakeup_time_ns = current_time_ns + Monitor._INACTIVE_SLEEP_MS * 1_000_000
+                            if self._new_contexts and self._new_contexts[0][0] < idle_wakeup_time_ns:
+                                idle_wakeup_time_ns = self._new_contexts[0][0]
+                        self._idle_wakeup_time_ns = idle_wakeup_time_ns
+
+                    if not self._active_contexts:
+                        if (current_time_ns - self._context_last_used_ns) >= self._monitor_disposal_time_ms * 1_000_000:
                             self._monitor_container.release_monitor(self)
                             break
 
-                        self.sleep(Monitor._INACTIVE_SLEEP_MS / 1000)
+                        self.sleep((idle_wakeup_time_ns - current_time_ns) / 1_000_000_000)
                         continue
 
-                    status_check_start_time_ns = perf_counter_ns()
+                    # Nothing time-consuming has happened since the start of this iteration, so reuse its timestamp
+                    status_check_start_time_ns = current_time_ns
                     self._context_last_used_ns = status_check_start_time_ns
                     status = self._check_host_status(self._host_check_timeout_ms)
                     delay_ms = -1
-                    first_added_new_context = None
+                    first_added_new_context: Optional[MonitoringContext] = None
 
                     monitor_context: MonitoringContext
-                    while (monitor_context := QueueUtils.get(self._active_contexts)) is not None:
-                        with self._lock:
-                            if not monitor_context.is_active:
-                                # Discard inactive contexts
-                                continue
-
-                            if first_added_new_context == monitor_context:
-                                # This context has already been processed by this loop.
-                                # Add it back to the queue and exit the loop.
-                                self._active_contexts.put(monitor_context)
-                                break
-
-                            # Process the context
-                            monitor_context.update_host_status(
-                                self._host_info.url,
-                                status_check_start_time_ns,
-                                status_check_start_time_ns + status.elapsed_time_ns,
-                                status.is_available)
-
-                            if not monitor_context.is_active or monitor_context.is_host_unavailable():
-                                continue
-
-                            # The context is still active and the host is still available. Continue monitoring the context.
-                            self._active_contexts.put(monitor_context)
-                            if first_added_new_context is None:
-                                first_added_new_context = monitor_context
-
-                            if delay_ms == -1 or delay_ms > monitor_context.failure_detection_interval_ms:
-                                delay_ms = monitor_context.failure_detection_interval_ms
+                    while (monitor_context := Monitor._poll(self._active_contexts)) is not None:
+                        if not monitor_context.is_active:
+                            # Discard inactive contexts
+                            continue
+
+                        if first_added_new_context == monitor_context:
+                            # This context has already been processed by this loop.
+                            # Add it back to the queue and exit the loop.
+                            self._active_contexts.append(monitor_context)
+                            break
+
+                        # Process the context
+                        monitor_context.update_host_status(
+                            self._host_info.url,
+                            status_check_start_time_ns,
+                            status_check_start_time_ns + status.elapsed_time_ns,
+                            status.is_available)
+
+                        if not monitor_context.is_active or monitor_context.is_host_unavailable():
+                            continue
+
+                        # The context is still active and the host is still available. Continue monitoring the context.
+                        self._active_contexts.append(monitor_context)
+                        if first_added_new_context is None:
+                            first_added_new_context = monitor_context
+
+                        interval_ms = monitor_context.failure_detection_interval_ms
+                        if delay_ms == -1 or delay_ms > interval_ms:
+                            delay_ms = interval_ms
 
                     if delay_ms == -1:
                         delay_ms = Monitor._INACTIVE_SLEEP_MS
@@ -515,6 +594,27 @@ class Monitor:
                     pass
             self.stop()
 
+    @staticmethod
+    def _get_monitoring_props(props: Properties) -> Properties:
+        prefix = Monitor._MONITORING_PROPERTY_PREFIX
+        prefix_len = len(prefix)
+        # Monitoring-specific properties take precedence over the regular properties with the same name
+        monitoring_props = Properties({key: value for key, value in props.items() if not key.startswith(prefix)})
+        monitoring_props.update({key[prefix_len:]: value for key, value in props.items() if key.startswith(prefix)})
+
+        # Set a default connect timeout if the user hasn't configured one
+        if monitoring_props.get(WrapperProperties.CONNECT_TIMEOUT_SEC.name, None) is None:
+            monitoring_props[WrapperProperties.CONNECT_TIMEOUT_SEC.name] = Monitor._DEFAULT_CONNECT_TIMEOUT_SEC
+
+        return monitoring_props
+
+    @staticmethod
+    def _poll(contexts: Deque[MonitoringContext]) -> Optional[MonitoringContext]:
+        try:
+            return contexts.popleft()
+        except IndexError:
+            return None
+
     def _check_host_status(self, host_check_timeout_ms: int) -> HostStatus:
         context = self._telemetry_factory.open_telemetry_context(
             "connection status check", TelemetryTraceLevel.FORCE_TOP_LEVEL)
@@ -524,19 +624,11 @@ class Monitor:
         try:
             driver_dialect = self._plugin_service.driver_dialect
             if self._monitoring_conn is None or driver_dialect.is_closed(self._monitoring_conn):
-                props_copy: Properties = copy(self._props)
-                for key, value in self._props.items():
-                    if key.startswith(Monitor._MONITORING_PROPERTY_PREFIX):
-                        props_copy[key[len(Monitor._MONITORING_PROPERTY_PREFIX):len(key)]] = value
-                        props_copy.pop(key, None)
-
-                # Set a default connect timeout if the user hasn't configured one
-                if props_copy.get(WrapperProperties.CONNECT_TIMEOUT_SEC.name, None) is None:
-                    props_copy[WrapperProperties.CONNECT_TIMEOUT_SEC.name] = Monitor._DEFAULT_CONNECT_TIMEOUT_SEC
-
                 logger.debug("Monitor.OpeningMonitorConnection", self._host_info.url)
+                self._close_monitoring_cursor()
                 start_ns = perf_counter_ns()
-                self._monitoring_conn = self._plugin_service.force_connect(self._host_info, props_copy, None)
+                self._monitoring_conn = self._plugin_service.force_connect(
+                    self._host_info, Properties(self._monitoring_props), None)
                 logger.debug("Monitor.OpenedMonitorConnection", self._host_info.url)
                 return Monitor.HostStatus(True, perf_counter_ns() - start_ns)
 
@@ -555,19 +647,37 @@ class Monitor:
         try:
             self._execute_conn_check(conn, timeout_sec)
             return True
-        except TimeoutError:
+        except (QueryTimeoutError, TimeoutError):
             return False
 
     def _execute_conn_check(self, conn: Connection, timeout_sec: float):
         driver_dialect = self._plugin_service.driver_dialect
-        with conn.cursor() as cursor:
-            query = Monitor._QUERY
+        if self._monitoring_cursor is None:
+            self._monitoring_cursor = conn.cursor()
+        cursor = self._monitoring_cursor
+        query = Monitor._QUERY
+        try:
             driver_dialect.execute("Cursor.execute", lambda: cursor.execute(query), query, exec_timeout=timeout_sec)
-            cursor.fetchone()
+            # Consume the entire result so that the cursor can be reused by the next check
+            cursor.fetchall()
+        except Exception:
+            # The cursor may still be busy with the failed query, so a new one is created for the next check
+            self._close_monitoring_cursor()
+            raise
+
+    def _close_monitoring_cursor(self):
+        cursor = self._monitoring_cursor
+        self._monitoring_cursor = None
+        if cursor is None:
+            return
+        try:
+            cursor.close()
+        except Exception:
+            pass
 
     # Used to help with testing
-    def sleep(self, duration: int):
-        sleep(duration)
+    def sleep(self, duration: float):
+        self._wakeup.wait(duration)
 
 
 class MonitoringThreadContainer:
@@ -578,55 +688,54 @@ class MonitoringThreadContainer:
 
     _instance: ClassVar[Optional[MonitoringThreadContainer]] = None
     _lock: ClassVar[RLock] = RLock()
-    _monitor_lock: ClassVar[RLock] = RLock()
 
-    _monitor_map: ConcurrentDict[str, Monitor] = ConcurrentDict()
-    _tasks_map: ConcurrentDict[Monitor, Future] = ConcurrentDict()
-    _executor: ClassVar[Executor] = ThreadPoolExecutor(thread_name_prefix="MonitoringThreadContainerExecutor")
+    _monitor_lock: RLock
+    _monitor_map: ConcurrentDict[str, Monitor]
+    _tasks_map: ConcurrentDict[Monitor, Thread]
 
     # This logic ensures that this class is a Singleton
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             with cls._lock:
                 if not cls._instance:
-                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    instance = super().__new__(cls, *args, **kwargs)
+                    # The state belongs to the instance rather than the class so that nothing survives clean_up()
+                    instance._monitor_lock = RLock()
+                    instance._monitor_map = ConcurrentDict()
+                    instance._tasks_map = ConcurrentDict()
+                    cls._instance = instance
         return cls._instance
 
     def get_or_create_monitor(self, host_aliases: FrozenSet[str], monitor_supplier: Callable) -> Monitor:
         if not host_aliases:
             raise AwsWrapperError(Messages.get("MonitoringThreadContainer.EmptyHostKeys"))
 
-        with self._monitor_lock:
-            monitor = None
-            any_alias = next(iter(host_aliases))
-            for host_alias in host_aliases:
-                monitor = self._monitor_map.get(host_alias)
-                any_alias = host_alias
-                if monitor is not None:
-                    break
-
-            def _get_or_create_monitor(_) -> Monitor:
-                supplied_monitor = monitor_supplier()
-                if supplied_monitor is None:
-                    raise AwsWrapperError(Messages.get("MonitoringThreadContainer.SupplierMonitorNone"))
-                self._tasks_map.compute_if_absent(
-                    supplied_monitor, lambda _: MonitoringThreadContainer._executor.submit(supplied_monitor.run))
-                return supplied_monitor
+        def _create_monitor() -> Monitor:
+            supplied_monitor = monitor_supplier()
+            if supplied_monitor is None:
+                raise AwsWrapperError(Messages.get("MonitoringThreadContainer.SupplierMonitorNone"))
+            self._tasks_map.compute_if_absent(supplied_monitor, MonitoringThreadContainer._start_monitor_thread)
+            return supplied_monitor
 
+        with self._monitor_lock:
+            # Looks up the monitor of any of the aliases, creating one if there is none, and maps every alias to it
+            monitor = self._monitor_map.compute_if_absent_for_all(host_aliases, _create_monitor)
             if monitor is None:
-                monitor = self._monitor_map.compute_if_absent(any_alias, _get_or_create_monitor)
-                if monitor is None:
-                    raise AwsWrapperError(
-                        Messages.get_formatted("MonitoringThreadContainer.ErrorGettingMonitor", host_aliases))
-
-            for host_alias in host_aliases:
-                self._monitor_map.put_if_absent(host_alias, monitor)
+                raise AwsWrapperError(
+                    Messages.get_formatted("MonitoringThreadContainer.ErrorGettingMonitor", host_aliases))
 
             return monitor
 
     @staticmethod
-    def _cancel(monitor, future: Future) -> None:
-        future.cancel()
+    def _start_monitor_thread(monitor: Monitor) -> Thread:
+        # Each monitor runs until it is stopped or disposed of, so it gets a dedicated thread rather than
+        # permanently occupying a worker of a shared thread pool.
+        thread = Thread(target=monitor.run, daemon=True, name=f"MonitoringThreadContainer-{monitor._host_info.url}")
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _cancel(monitor, thread: Thread) -> None:
         monitor.stop()
         return None
 
@@ -658,24 +767,16 @@ class MonitoringThreadContainer:
     def _release_resources(self):
         with self._monitor_lock:
             self._monitor_map.clear()
-            self._tasks_map.apply_if(
-                lambda monitor, future: not future.done() and not future.cancelled(),
-                lambda monitor, future: future.cancel())
 
             for monitor, _ in self._tasks_map.items():
                 monitor.stop()
 
             self._tasks_map.clear()
 
-            # Reset the executor.
-            self._executor.shutdown(wait=False)
-            MonitoringThreadContainer._executor = ThreadPoolExecutor(thread_name_prefix="MonitoringThreadContainerExecutor")
-
 
 class MonitorService:
     def __init__(self, plugin_service: PluginService):
         self._plugin_service: PluginService = plugin_service
-        self._monitor_container: MonitoringThreadContainer = MonitoringThreadContainer()
         self._cached_monitor_aliases: Optional[FrozenSet[str]] = None
         self._cached_monitor: Optional[ReferenceType[Monitor]] = None
 
@@ -698,8 +799,10 @@ class MonitorService:
                 or monitor.is_stopped \
                 or self._cached_monitor_aliases is None \
                 or self._cached_monitor_aliases != host_aliases:
-            monitor = self._monitor_container.get_or_create_monitor(
-                host_aliases, lambda: self._create_monitor(host_info, props, self._monitor_container))
+            # The container is looked up on every use, as clean_up() replaces it
+            monitor_container = MonitoringThreadContainer()
+            monitor = monitor_container.get_or_create_monitor(
+                host_aliases, lambda: self._create_monitor(host_info, props, monitor_container))
             self._cached_monitor = ref(monitor)
             self._cached_monitor_aliases = host_aliases
 
@@ -718,11 +821,13 @@ class MonitorService:
         monitor.stop_monitoring(context)
 
     def stop_monitoring_host(self, host_aliases: FrozenSet):
+        monitor_container = MonitoringThreadContainer()
         for alias in host_aliases:
-            monitor = self._monitor_container.get_monitor(alias)
+            monitor = monitor_container.get_monitor(alias)
             if monitor is not None:
                 monitor.clear_contexts()
                 return
 
     def release_resources(self):
-        self._monitor_container = None
+        self._cached_monitor = None
+        self._cached_monitor_aliases = None
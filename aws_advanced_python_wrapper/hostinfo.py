@@ -56,7 +56,8 @@ class HostInfo:
         self.last_update_time = last_update_time
 
         self._aliases: Set[str] = set()
-        self._all_aliases: Set[str] = {self.as_alias()}
+        # Kept frozen and replaced on change, as it is read far more often than it is modified
+        self._all_aliases: FrozenSet[str] = frozenset((self.as_alias(),))
 
     def __eq__(self, other: object):
         if self is object:
@@ -85,7 +86,7 @@ class HostInfo:
 
     @property
     def all_aliases(self) -> FrozenSet[str]:
-        return frozenset(self._all_aliases)
+        return self._all_aliases
 
     def as_alias(self) -> str:
         return f"{self.host}:{self.port}" if self.is_port_specified() else self.host
@@ -94,12 +95,11 @@ class HostInfo:
         if not aliases:
             return
 
-        for alias in aliases:
-            self._aliases.add(alias)
-            self._all_aliases.add(alias)
+        self._aliases.update(aliases)
+        self._all_aliases = self._all_aliases.union(aliases)
 
     def as_aliases(self) -> FrozenSet[str]:
-        return frozenset(self.all_aliases)
+        return self._all_aliases
 
     def remove_alias(self, *kwargs):
         if not kwargs or len(kwargs) == 0:
@@ -107,12 +107,11 @@ class HostInfo:
 
         for x in kwargs:
             self._aliases.discard(x)
-            self._all_aliases.discard(x)
+        self._all_aliases = self._all_aliases.difference(kwargs)
 
     def reset_aliases(self):
         self._aliases.clear()
-        self._all_aliases.clear()
-        self._all_aliases.add(self.as_alias())
+        self._all_aliases = frozenset((self.as_alias(),))
 
     def is_port_specified(self) -> bool:
         return self.port != HostInfo.NO_PORT
@@ -447,10 +447,10 @@ class PluginServiceImpl(PluginService, HostListProviderService, CanReleaseResour
             raise AwsWrapperError(Messages.get("PluginServiceImpl.UnableToUpdateTransactionStatus"))
 
     def is_network_bound_method(self, method_name: str):
-        if len(self.network_bound_methods) == 1 and \
-                list(self.network_bound_methods)[0] == "*":
+        network_bound_methods = self.network_bound_methods
+        if len(network_bound_methods) == 1 and "*" in network_bound_methods:
             return True
-        return method_name in self.network_bound_methods
+        return method_name in network_bound_methods
 
     def update_dialect(self, connection: Optional[Connection] = None):
         # Updates both database dialects and driver dialect
@@ -566,12 +566,10 @@ class PluginServiceImpl(PluginService, HostListProviderService, CanReleaseResour
         return self._host_list_provider is StaticHostListProvider
 
     def is_network_exception(self, error: Optional[Exception] = None, sql_state: Optional[str] = None) -> bool:
-        return self._exception_manager.is_network_exception(
-            dialect=self.database_dialect, error=error, sql_state=sql_state)
+        return self._exception_manager.is_network_exception(self.database_dialect, error, sql_state)
 
     def is_login_exception(self, error: Optional[Exception] = None, sql_state: Optional[str] = None) -> bool:
-        return self._exception_manager.is_login_exception(
-            dialect=self.database_dialect, error=error, sql_state=sql_state)
+        return self._exception_manager.is_login_exception(self.database_dialect, error, sql_state)
 
     def get_connection_provider_manager(self) -> ConnectionProviderManager:
         return self._container.plugin_manager.connection_provider_manager
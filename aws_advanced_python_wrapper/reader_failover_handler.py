@@ -14,21 +14,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, Set, Tuple
 
-from aws_advanced_python_wrapper.utils.properties import PropertiesUtils
+from aws_advanced_python_wrapper.utils.properties import (Properties,
+                                                          PropertiesUtils)
 
 if TYPE_CHECKING:
     from aws_advanced_python_wrapper.plugin_service import PluginService
-    from aws_advanced_python_wrapper.utils.properties import Properties
     from aws_advanced_python_wrapper.pep249 import Connection
 
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
-from copy import deepcopy
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                TimeoutError, wait)
+from itertools import islice
+from logging import DEBUG
 from random import shuffle
 from threading import Event
-from time import sleep
 from typing import Optional
 
 from aws_advanced_python_wrapper.failover_result import ReaderFailoverResult
@@ -69,6 +70,12 @@ class ReaderFailoverHandler:
         """
         pass
 
+    def close(self):
+        """
+        Release the resources held by this handler. The handler should not be used afterwards.
+        """
+        pass
+
 
 class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
     failed_reader_failover_result = ReaderFailoverResult(None, False, None, None)
@@ -78,14 +85,22 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
             plugin_service: PluginService,
             properties: Properties,
             max_timeout_sec: float = 60,
-            timeout_sec: float = 30):
+            timeout_sec: float = 30,
+            max_parallel_attempts: int = 4):
         self._plugin_service = plugin_service
         self._properties = properties
         self._max_failover_timeout_sec = max_timeout_sec
         self._timeout_sec = timeout_sec
+        self._max_parallel_attempts = max_parallel_attempts
         mode = get_failover_mode(self._properties)
         self._strict_reader_failover = True if mode is not None and mode == FailoverMode.STRICT_READER else False
         self._timeout_event = Event()
+        # Resolved once, as every failed connection attempt needs to classify its error
+        self._is_network_exception = self._plugin_service.is_network_exception
+        # Reused by every failover of this handler. There is a worker for the failover task and for each connection
+        # attempt it can have in flight, so attempts start immediately rather than waiting in a queue.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_parallel_attempts + 1, thread_name_prefix="ReaderFailoverHandlerExecutor")
 
     @property
     def timeout_sec(self):
@@ -95,30 +110,33 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
     def timeout_sec(self, value):
         self._timeout_sec = value
 
+    @property
+    def max_parallel_attempts(self):
+        return self._max_parallel_attempts
+
     def failover(self, current_topology: Tuple[HostInfo, ...], current_host: Optional[HostInfo]) -> ReaderFailoverResult:
         if current_topology is None or len(current_topology) == 0:
             logger.debug("ReaderFailoverHandler.InvalidTopology", "failover")
             return ReaderFailoverHandlerImpl.failed_reader_failover_result
 
         result: ReaderFailoverResult = ReaderFailoverHandlerImpl.failed_reader_failover_result
-        with ThreadPoolExecutor(thread_name_prefix="ReaderFailoverHandlerExecutor") as executor:
-            future = executor.submit(self._internal_failover_task, current_topology, current_host)
-
-            try:
-                result = future.result(timeout=self._max_failover_timeout_sec)
-                if result is None:
-                    result = ReaderFailoverHandlerImpl.failed_reader_failover_result
-            except TimeoutError:
-                self._timeout_event.set()
+        future = self._executor.submit(self._internal_failover_task, current_topology, current_host)
+
+        try:
+            result = future.result(timeout=self._max_failover_timeout_sec)
+        except TimeoutError:
+            self._timeout_event.set()
 
         return result
 
     def _internal_failover_task(
             self, topology: Tuple[HostInfo, ...], current_host: Optional[HostInfo]) -> ReaderFailoverResult:
         try:
+            # The topology does not change between attempts, so the hosts are only ordered once per failover
+            hosts_by_priority = ReaderFailoverHandlerImpl.get_hosts_by_priority(topology, self._strict_reader_failover)
             while not self._timeout_event.is_set():
-                result = self._failover_internal(topology, current_host)
-                if result is not None and result.is_connected:
+                result = self._failover_internal(hosts_by_priority, current_host)
+                if result.is_connected:
                     if not self._strict_reader_failover:
                         return result  # any host is fine
 
@@ -126,11 +144,11 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
 
                     self._plugin_service.force_refresh_host_list(result.connection)
                     if result.new_host is not None:
-                        topology = self._plugin_service.all_hosts
-                        for host in topology:
-                            # found new connection host in the latest topology
-                            if host.url == result.new_host.url and host.role == HostRole.READER:
-                                return result
+                        new_host_url = result.new_host.url
+                        # found new connection host in the latest topology
+                        if any(host.role is HostRole.READER and host.url == new_host_url
+                               for host in self._plugin_service.all_hosts):
+                            return result
 
                     # New host is not found in the latest topology. There are few possible reasons for that.
                     # - Host is not yet presented in the topology due to failover process in progress
@@ -139,17 +157,18 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
                     if result.connection is not None:
                         result.connection.close()
 
-                sleep(1)  # Sleep for 1 second
+                # Wait for 1 second, or less if the failover times out in the meantime
+                self._timeout_event.wait(1)
         except Exception as err:
             return ReaderFailoverResult(None, False, None, err)
 
         return ReaderFailoverHandlerImpl.failed_reader_failover_result
 
-    def _failover_internal(self, hosts: Tuple[HostInfo, ...], current_host: Optional[HostInfo]) -> ReaderFailoverResult:
+    def _failover_internal(
+            self, hosts_by_priority: Tuple[HostInfo, ...], current_host: Optional[HostInfo]) -> ReaderFailoverResult:
         if current_host is not None:
             self._plugin_service.set_availability(current_host.all_aliases, HostAvailability.UNAVAILABLE)
 
-        hosts_by_priority = ReaderFailoverHandlerImpl.get_hosts_by_priority(hosts, self._strict_reader_failover)
         return self._get_connection_from_host_group(hosts_by_priority)
 
     def get_reader_connection(self, hosts: Tuple[HostInfo, ...]) -> ReaderFailoverResult:
@@ -161,37 +180,66 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
         return self._get_connection_from_host_group(hosts_by_priority)
 
     def _get_connection_from_host_group(self, hosts: Tuple[HostInfo, ...]) -> ReaderFailoverResult:
-        for i in range(0, len(hosts), 2):
-            result = self._get_result_from_next_task_batch(hosts, i)
-            if result.is_connected or result.exception is not None:
-                return result
+        # Try up to max_parallel_attempts hosts at a time in order of priority,
+        # starting an attempt for the next host whenever an attempt fails.
+        executor = self._executor
+        remaining_hosts = iter(hosts)
+        pending: Set[Future] = {executor.submit(self.attempt_connection, host)
+                                for host in islice(remaining_hosts, self._max_parallel_attempts)}
+        result = ReaderFailoverHandlerImpl.failed_reader_failover_result
+        completed_future = None
+
+        while pending and completed_future is None:
+            done, pending = wait(pending, timeout=self.timeout_sec, return_when=FIRST_COMPLETED)
+            if not done:
+                self._timeout_event.set()
+                break
 
-            sleep(1)  # Sleep for 1 second
+            for future in done:
+                future_result = future.result()
+                if future_result.is_connected or future_result.exception is not None:
+                    result = future_result
+                    completed_future = future
+                    break
 
-        return ReaderFailoverHandlerImpl.failed_reader_failover_result
+            if completed_future is None and not self._timeout_event.is_set():
+                pending.update(executor.submit(self.attempt_connection, host)
+                               for host in islice(remaining_hosts, len(done)))
 
-    def _get_result_from_next_task_batch(self, hosts: Tuple[HostInfo, ...], i: int) -> ReaderFailoverResult:
-        with ThreadPoolExecutor(thread_name_prefix="ReaderFailoverHandlerRetrieveResultsExecutor") as executor:
-            futures = [executor.submit(self.attempt_connection, hosts[i])]
-            if i + 1 < len(hosts):
-                futures.append(executor.submit(self.attempt_connection, hosts[i + 1]))
-
-            try:
-                for future in as_completed(futures, timeout=self.timeout_sec):
-                    result = future.result()
-                    if result.is_connected or result.exception is not None:
-                        executor.shutdown(wait=False)
-                        return result
-            except TimeoutError:
-                self._timeout_event.set()
-            finally:
-                self._timeout_event.set()
+        if completed_future is not None:
+            # Another attempt may have completed at the same time as the one providing the result
+            pending.update(future for future in done if future is not completed_future)
 
-        return ReaderFailoverHandlerImpl.failed_reader_failover_result
+        for future in pending:
+            # Attempts that have not started yet are cancelled.
+            # Connections opened by the other attempts will not be used, so they are closed once the attempts finish.
+            if not future.cancel():
+                future.add_done_callback(ReaderFailoverHandlerImpl._close_unused_connection)
+
+        return result
+
+    def close(self):
+        # Attempts that are still connecting are not waited for, their threads exit once they finish
+        self._executor.shutdown(wait=False)
+
+    @staticmethod
+    def _close_unused_connection(future: Future):
+        if future.cancelled():
+            return
+        try:
+            connection = future.result().connection
+            if connection is not None:
+                connection.close()
+        except Exception:
+            # Do nothing
+            pass
 
     def attempt_connection(self, host: HostInfo) -> ReaderFailoverResult:
-        props: Properties = deepcopy(self._properties)
-        logger.debug("ReaderFailoverHandler.AttemptingReaderConnection", host.url, PropertiesUtils.mask_properties(props))
+        # A shallow copy is enough to keep the connect pipeline from modifying the handler's properties
+        props: Properties = Properties(self._properties)
+        if logger.is_enabled_for(DEBUG):
+            logger.debug(
+                "ReaderFailoverHandler.AttemptingReaderConnection", host.url, PropertiesUtils.mask_properties(props))
 
         try:
             conn: Connection = self._plugin_service.force_connect(host, props, self._timeout_event)
@@ -202,51 +250,38 @@ class ReaderFailoverHandlerImpl(ReaderFailoverHandler):
         except Exception as ex:
             logger.debug("ReaderFailoverHandler.FailedReaderConnection", host.url)
             self._plugin_service.set_availability(host.all_aliases, HostAvailability.UNAVAILABLE)
-            if not self._plugin_service.is_network_exception(ex):
+            if not self._is_network_exception(ex):
                 return ReaderFailoverResult(None, False, None, ex)
 
         return ReaderFailoverHandlerImpl.failed_reader_failover_result
 
     @classmethod
     def get_hosts_by_priority(cls, hosts, readers_only: bool):
-        active_readers: List[HostInfo] = []
-        down_hosts: List[HostInfo] = []
-        writer_host: Optional[HostInfo] = None
-
-        for host in hosts:
-            if host.role == HostRole.WRITER:
-                writer_host = host
-                continue
-            if host.get_raw_availability() == HostAvailability.AVAILABLE:
-                active_readers.append(host)
-            else:
-                down_hosts.append(host)
-
-        shuffle(active_readers)
-        shuffle(down_hosts)
-
-        hosts_by_priority = active_readers
-        num_readers = len(active_readers) + len(down_hosts)
-        if writer_host is not None and (not readers_only or num_readers == 0):
-            hosts_by_priority.append(writer_host)
-        hosts_by_priority += down_hosts
+        active_readers, down_hosts, writer_host = cls._partition_hosts(hosts)
 
-        return tuple(hosts_by_priority)
+        if writer_host is not None and (not readers_only or (not active_readers and not down_hosts)):
+            return (*active_readers, writer_host, *down_hosts)
+        return (*active_readers, *down_hosts)
 
     @classmethod
     def get_reader_hosts_by_priority(cls, hosts: Tuple[HostInfo, ...]) -> Tuple[HostInfo, ...]:
+        active_readers, down_hosts, _ = cls._partition_hosts(hosts)
+        return (*active_readers, *down_hosts)
+
+    @staticmethod
+    def _partition_hosts(hosts) -> Tuple[List[HostInfo], List[HostInfo], Optional[HostInfo]]:
         active_readers: List[HostInfo] = []
         down_hosts: List[HostInfo] = []
+        writer_host: Optional[HostInfo] = None
 
         for host in hosts:
-            if host.role == HostRole.WRITER:
-                continue
-            if host.get_raw_availability() == HostAvailability.AVAILABLE:
+            if host.role is HostRole.WRITER:
+                writer_host = host
+            elif host.get_raw_availability() is HostAvailability.AVAILABLE:
                 active_readers.append(host)
             else:
                 down_hosts.append(host)
 
         shuffle(active_readers)
         shuffle(down_hosts)
-
-        return tuple(active_readers + down_hosts)
+        return active_readers, down_hosts, writer_host
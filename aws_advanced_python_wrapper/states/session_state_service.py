@@ -109,7 +109,7 @@ class SessionStateServiceImpl(SessionStateService):
         self._props: Properties = props
 
     def log_current_state(self):
-        logger.debug(f"Current session state: \n{self._session_state}")
+        logger.debug("SessionStateServiceImpl.CurrentSessionState", self._session_state)
 
     def _transfer_state_enabled_setting(self) -> bool:
         return WrapperProperties.TRANSFER_SESSION_STATE_ON_SWITCH.get_bool(self._props)
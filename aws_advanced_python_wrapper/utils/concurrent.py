@@ -20,7 +20,8 @@ if TYPE_CHECKING:
     from collections.abc import ItemsView
 
 from threading import Lock
-from typing import Callable, Generic, KeysView, List, Optional, TypeVar
+from typing import (Callable, Collection, Generic, KeysView, List, Optional,
+                    TypeVar)
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -71,6 +72,24 @@ class ConcurrentDict(Generic[K, V]):
                 return new_value
             return existing_value
 
+    def compute_if_absent_for_all(self, keys: Collection[K], mapping_func: Callable) -> Optional[V]:
+        with self._lock:
+            value = None
+            for key in keys:
+                value = self._dict.get(key)
+                if value is not None:
+                    break
+
+            if value is None:
+                value = mapping_func()
+                if value is None:
+                    return None
+
+            for key in keys:
+                if self._dict.get(key) is None:
+                    self._dict[key] = value
+            return value
+
     def remove(self, key: K) -> V:
         with self._lock:
             return self._dict.pop(key, None)
@@ -49,22 +49,3 @@ def preserve_transaction_status_with_timeout(executor: Executor, timeout_sec, dr
         return func_wrapper
 
     return preserve_transaction_status_with_timeout_decorator
-
-
-def timeout(executor: Executor, timeout_sec):
-    """
-    Timeout decorator, timeout in seconds
-    """
-
-    def timeout_decorator(func):
-        @functools.wraps(func)
-        def func_wrapper(*args, **kwargs):
-
-            future = executor.submit(func, *args, **kwargs)
-
-            # raises TimeoutError on timeout
-            return future.result(timeout=timeout_sec)
-
-        return func_wrapper
-
-    return timeout_decorator
@@ -15,61 +15,126 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
 from logging import getLogger
+from typing import Callable, ClassVar, Dict, Optional, Tuple
 
 from ResourceBundle import NotInResourceBundleError
 
 from aws_advanced_python_wrapper.utils.messages import Messages
 
+_DEBUG = logging.DEBUG
+_ERROR = logging.ERROR
+_WARNING = logging.WARNING
+_INFO = logging.INFO
+
+_FORMAT_TOKEN_PATTERN = re.compile(r"\{\{|\}\}|%|\{(\d*)\}")
+
+
+@lru_cache(maxsize=1024)
+def _resolve(key: str) -> Optional[str]:
+    """
+    Look up the bundle message for the given key. Misses are cached as well so the bundle lookup and the
+    :py:class:`NotInResourceBundleError` raised for unknown keys happen at most once per key.
+    """
+    try:
+        return Messages.get(key)
+    except NotInResourceBundleError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _to_printf(template: str) -> Tuple[str, int]:
+    """
+    Convert a :py:meth:`str.format` template using positional placeholders such as '{}' or '{0}' to its printf-style
+    equivalent. Returns the converted template along with the number of placeholders it contains.
+    """
+    num_placeholders = 0
+
+    def _replace(match) -> str:
+        nonlocal num_placeholders
+        token = match.group(0)
+        if token == "%":
+            return "%%"
+        if token == "{{":
+            return "{"
+        if token == "}}":
+            return "}"
+        num_placeholders += 1
+        return "%s"
+
+    return _FORMAT_TOKEN_PATTERN.sub(_replace, template), num_placeholders
+
+
+def _get_template(msg, args):
+    """
+    Resolve the message template for the given key. When arguments are supplied, the template is converted to
+    printf-style so the logging module can defer interpolation until a handler actually emits the record.
+    Arguments without a matching placeholder are dropped, mirroring :py:meth:`str.format`.
+    """
+    # Non-string messages such as exceptions are never bundle keys and should not be held on to by the cache.
+    template = _resolve(msg) if isinstance(msg, str) else None
+    if template is None:
+        template = msg
+
+    if args:
+        printf_template, num_placeholders = _to_printf(str(template))
+        if num_placeholders == 0:
+            # Nothing to interpolate, so the logging module will not unescape '%%'. Only unescape the braces instead.
+            return str(template).replace("{{", "{").replace("}}", "}"), ()
+        return printf_template, args[:num_placeholders]
+    return template, args
+
 
 class Logger:
+    __slots__ = ("logger", "_is_enabled_for", "_debug", "_error", "_warning", "_info")
+
+    # Logger instances by name, so that Logger(name) is Logger(name).
+    _instances: ClassVar[Dict[str, Logger]] = {}
+
+    def __new__(cls, name: str):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances.setdefault(name, super().__new__(cls))
+        return instance
+
     def __init__(self, name: str):
+        if hasattr(self, "logger"):
+            # Already initialized by a previous Logger(name) call.
+            return
+
         self.logger = getLogger(name)
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._debug = self.logger.debug
+        self._error = self.logger.error
+        self._warning = self.logger.warning
+        self._info = self.logger.info
 
-    def debug(self, msg, *args, **kwargs):
-        if not self.logger.isEnabledFor(logging.DEBUG):
-            return
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether messages of the given level would be logged. Use this to skip building expensive arguments for
+        messages that would be dropped anyway.
+        """
+        return self._is_enabled_for(level)
 
-        if args is not None and len(args) > 0:
-            self.logger.debug(Messages.get_formatted(msg, *args), **kwargs)
-        else:
-            try:
-                self.logger.debug(Messages.get(msg), **kwargs)
-            except NotInResourceBundleError:
-                self.logger.debug(msg, **kwargs)
+    def debug(self, msg, *args, **kwargs):
+        self._log(_DEBUG, self._debug, msg, args, kwargs)
 
     def error(self, msg, *args, **kwargs):
-        if not self.logger.isEnabledFor(logging.ERROR):
-            return
-
-        if args is not None and len(args) > 0:
-            self.logger.error(Messages.get_formatted(msg, *args), **kwargs)
-        else:
-            try:
-                self.logger.error(Messages.get(msg), **kwargs)
-            except NotInResourceBundleError:
-                self.logger.error(msg, **kwargs)
+        self._log(_ERROR, self._error, msg, args, kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        if not self.logger.isEnabledFor(logging.WARNING):
-            return
-
-        if args is not None and len(args) > 0:
-            self.logger.warning(Messages.get_formatted(msg, *args), **kwargs)
-        else:
-            try:
-                self.logger.warning(Messages.get(msg), **kwargs)
-            except NotInResourceBundleError:
-                self.logger.warning(msg, **kwargs)
+        self._log(_WARNING, self._warning, msg, args, kwargs)
 
     def info(self, msg, *args, **kwargs):
-        if not self.logger.isEnabledFor(logging.INFO):
+        self._log(_INFO, self._info, msg, args, kwargs)
+
+    def _log(self, level: int, emit: Callable, msg, args, kwargs):
+        if not self._is_enabled_for(level):
             return
 
-        if args is not None and len(args) > 0:
-            self.logger.info(Messages.get_formatted(msg, *args), **kwargs)
-        else:
-            try:
-                self.logger.info(Messages.get(msg), **kwargs)
-            except NotInResourceBundleError:
-                self.logger.info(msg, **kwargs)
+        template, args = _get_template(msg, args)
+        # Attribute the record to the public method rather than this helper.
+        kwargs.setdefault("stacklevel", 2)
+        emit(template, *args, **kwargs)
@@ -25,9 +25,9 @@ if TYPE_CHECKING:
     from aws_advanced_python_wrapper.reader_failover_handler import ReaderFailoverHandler
 
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from threading import Event
-from time import sleep
+from time import perf_counter, sleep
 from typing import Optional
 
 from aws_advanced_python_wrapper import LogUtils
@@ -120,19 +120,24 @@ class WriterFailoverHandlerImpl(WriterFailoverHandler):
 
             with ThreadPoolExecutor(thread_name_prefix="WriterFailoverHandlerExecutor") as executor:
                 try:
-                    futures = [executor.submit(self.reconnect_to_writer, writer_host),
-                               executor.submit(self.wait_for_new_writer, current_topology, writer_host)]
-                    for future in as_completed(futures, timeout=self._max_failover_timeout_sec):
-                        result = future.result()
-                        if result.is_connected:
-                            executor.shutdown(wait=False)
-                            self.log_task_success(result)
-                            return result
-                        if result.exception is not None:
-                            executor.shutdown(wait=False)
-                            return result
-                except TimeoutError:
-                    self._timeout_event.set()
+                    pending = {executor.submit(self.reconnect_to_writer, writer_host),
+                               executor.submit(self.wait_for_new_writer, current_topology, writer_host)}
+                    end_time = perf_counter() + self._max_failover_timeout_sec
+                    while pending:
+                        done, pending = wait(pending, timeout=end_time - perf_counter(), return_when=FIRST_COMPLETED)
+                        if not done:
+                            # Timed out, the finally block below stops the remaining task
+                            break
+
+                        for future in done:
+                            result = future.result()
+                            if result.is_connected:
+                                executor.shutdown(wait=False)
+                                self.log_task_success(result)
+                                return result
+                            if result.exception is not None:
+                                executor.shutdown(wait=False)
+                                return result
                 finally:
                     self._timeout_event.set()
 
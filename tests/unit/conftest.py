@@ -19,6 +19,8 @@ from aws_advanced_python_wrapper.driver_dialect_manager import \
     DriverDialectManager
 from aws_advanced_python_wrapper.exception_handling import ExceptionManager
 from aws_advanced_python_wrapper.host_list_provider import RdsHostListProvider
+from aws_advanced_python_wrapper.host_monitoring_plugin import \
+    HostMonitoringPlugin
 from aws_advanced_python_wrapper.plugin_service import PluginServiceImpl
 
 
@@ -28,6 +30,7 @@ def pytest_runtest_setup(item):
     RdsHostListProvider._cluster_ids_to_update.clear()
     PluginServiceImpl._host_availability_expiring_cache.clear()
     DatabaseDialectManager._known_endpoint_dialects.clear()
+    HostMonitoringPlugin._rds_type_cache.clear()
 
     ConnectionProviderManager.reset_provider()
     DatabaseDialectManager.reset_custom_dialect()
@@ -33,6 +33,21 @@ def test_put_if_absent(test_dict):
     assert "a" == test_dict.get(1)
 
 
+def test_compute_if_absent_for_all(mocker, test_dict):
+    mapping_func = mocker.MagicMock(return_value="a")
+    assert "a" == test_dict.compute_if_absent_for_all([1, 2], mapping_func)
+    assert "a" == test_dict.get(1)
+    assert "a" == test_dict.get(2)
+
+    assert "a" == test_dict.compute_if_absent_for_all([2, 3], mapping_func)
+    assert "a" == test_dict.get(3)
+    mapping_func.assert_called_once()
+
+    mapping_func.return_value = None
+    assert test_dict.compute_if_absent_for_all([4], mapping_func) is None
+    assert test_dict.get(4) is None
+
+
 def test_put_if_absent__multithreaded(test_dict):
     n = AtomicInt()
     num_threads = 50
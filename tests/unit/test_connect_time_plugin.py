@@ -0,0 +1,36 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License").
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+
+from aws_advanced_python_wrapper.connect_time_plugin import ConnectTimePlugin
+from aws_advanced_python_wrapper.utils.messages import Messages
+
+
+def test_connect(mocker, caplog):
+    ConnectTimePlugin.reset_connect_time()
+    expected_connection = mocker.MagicMock()
+    connect_func = mocker.MagicMock(return_value=expected_connection)
+    plugin = ConnectTimePlugin()
+
+    with caplog.at_level(logging.DEBUG, logger="aws_advanced_python_wrapper.connect_time_plugin"):
+        connection = plugin.connect(
+            mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock(), True, connect_func)
+
+    assert expected_connection == connection
+    connect_func.assert_called_once()
+    assert ConnectTimePlugin.connect_time > 0
+    assert 1 == len(caplog.records)
+    assert Messages.get_formatted("ConnectTimePlugin.ConnectTime", ConnectTimePlugin.connect_time) == \
+        caplog.records[0].getMessage()
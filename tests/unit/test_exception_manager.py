@@ -0,0 +1,87 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License").
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from aws_advanced_python_wrapper.exception_handling import ExceptionManager
+
+
+@pytest.fixture
+def mock_dialect_handler(mocker):
+    handler = mocker.MagicMock()
+    handler.is_network_exception.return_value = True
+    handler.is_login_exception.return_value = True
+    return handler
+
+
+@pytest.fixture
+def mock_dialect(mocker, mock_dialect_handler):
+    dialect = mocker.MagicMock()
+    dialect.exception_handler = mock_dialect_handler
+    return dialect
+
+
+@pytest.fixture
+def mock_custom_handler(mocker):
+    handler = mocker.MagicMock()
+    handler.is_network_exception.return_value = False
+    handler.is_login_exception.return_value = False
+    return handler
+
+
+def test_uses_dialect_handler(mock_dialect, mock_dialect_handler):
+    manager = ExceptionManager()
+    error = Exception()
+
+    assert manager.is_network_exception(mock_dialect, error, "08001")
+    assert manager.is_login_exception(mock_dialect, error, "28000")
+    mock_dialect_handler.is_network_exception.assert_called_once_with(error, "08001")
+    mock_dialect_handler.is_login_exception.assert_called_once_with(error, "28000")
+
+
+def test_uses_custom_handler(mock_dialect, mock_dialect_handler, mock_custom_handler):
+    ExceptionManager.set_custom_handler(mock_custom_handler)
+    assert mock_custom_handler == ExceptionManager.get_custom_handler()
+    manager = ExceptionManager()
+
+    assert not manager.is_network_exception(mock_dialect, Exception())
+    assert not manager.is_login_exception(mock_dialect, Exception())
+    mock_custom_handler.is_network_exception.assert_called_once()
+    mock_custom_handler.is_login_exception.assert_called_once()
+    mock_dialect_handler.is_network_exception.assert_not_called()
+    mock_dialect_handler.is_login_exception.assert_not_called()
+
+    ExceptionManager.reset_custom_handler()
+    assert ExceptionManager.get_custom_handler() is None
+    assert manager.is_network_exception(mock_dialect, Exception())
+    mock_dialect_handler.is_network_exception.assert_called_once()
+
+
+def test_no_dialect():
+    manager = ExceptionManager()
+
+    assert not manager.is_network_exception(None, Exception())
+    assert not manager.is_login_exception(None, Exception())
+
+
+def test_dialect_handler_resolved_once(mocker, mock_dialect_handler):
+    dialect = mocker.MagicMock()
+    exception_handler_property = mocker.PropertyMock(return_value=mock_dialect_handler)
+    type(dialect).exception_handler = exception_handler_property
+    manager = ExceptionManager()
+
+    assert manager.is_network_exception(dialect, Exception())
+    assert manager.is_network_exception(dialect, Exception())
+    assert manager.is_login_exception(dialect, Exception())
+    exception_handler_property.assert_called_once()
@@ -259,6 +259,26 @@ def test_failover_reader_with_valid_failed_host(plugin_service_mock, host_list_p
         set_current_connection_mock.assert_called_with(conn_mock, host)
 
 
+def test_release_resources(plugin_service_mock, reader_failover_handler_mock):
+    properties = Properties()
+    WrapperProperties.ENABLE_FAILOVER.set(properties, "True")
+    plugin = FailoverPlugin(plugin_service_mock, properties)
+    plugin.init_host_provider(properties, MagicMock(), MagicMock())
+    plugin._reader_failover_handler = reader_failover_handler_mock
+
+    plugin.release_resources()
+    reader_failover_handler_mock.close.assert_called_once()
+
+
+def test_release_resources_failover_disabled(plugin_service_mock):
+    properties = Properties()
+    WrapperProperties.ENABLE_FAILOVER.set(properties, "False")
+    plugin = FailoverPlugin(plugin_service_mock, properties)
+    plugin.init_host_provider(properties, MagicMock(), MagicMock())
+
+    plugin.release_resources()
+
+
 def test_failover_reader_with_no_failed_host(plugin_service_mock, host_list_provider_service_mock,
                                              init_host_provider_func_mock, reader_failover_handler_mock):
     host: HostInfo = HostInfo("host")
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import psycopg
 import pytest
 
@@ -136,6 +138,18 @@ def test_execute_monitoring_enabled(mocker, plugin, mock_monitor_service, mock_e
     mock_execute_func.assert_called_once()
 
 
+def test_execute_monitoring_settings(mocker, mock_plugin_service, props, mock_monitor_service, mock_execute_func):
+    WrapperProperties.FAILURE_DETECTION_TIME_MS.set(props, "1000")
+    WrapperProperties.FAILURE_DETECTION_INTERVAL_MS.set(props, "200")
+    WrapperProperties.FAILURE_DETECTION_COUNT.set(props, "5")
+    plugin = init_plugin(mock_plugin_service, props, mock_monitor_service)
+    plugin.execute(mocker.MagicMock(), "Cursor.execute", mock_execute_func, "SELECT 1")
+
+    args = mock_monitor_service.start_monitoring.call_args.args
+    assert (1000, 200, 5) == args[-3:]
+    mock_execute_func.assert_called_once()
+
+
 def test_execute_cleanup__error_checking_connection_status(
         mocker, plugin, mock_monitor_service, mock_execute_func, mock_context, mock_conn, mock_driver_dialect):
     mock_context.is_host_unavailable.return_value = True
@@ -166,6 +180,31 @@ def test_connect(mocker, plugin, host_info, props, mock_conn, mock_plugin_servic
     assert mock_conn == connection
 
 
+def test_connect__rds_type_cached(mocker, plugin, host_info, props, mock_conn):
+    mock_connect_func = mocker.MagicMock()
+    mock_connect_func.return_value = mock_conn
+    spy = mocker.spy(plugin._rds_utils, "identify_rds_type")
+
+    plugin.connect(mocker.MagicMock(), mocker.MagicMock(), host_info, props, True, mock_connect_func)
+    plugin.connect(mocker.MagicMock(), mocker.MagicMock(), host_info, props, False, mock_connect_func)
+    spy.assert_called_once_with(host_info.host)
+
+
+def test_identify_rds_type__concurrent_evictions(mocker, plugin):
+    mocker.patch.object(HostMonitoringPlugin, "_RDS_TYPE_CACHE_MAX_SIZE", 8)
+
+    def identify_rds_types(thread_id: int):
+        for i in range(500):
+            plugin._identify_rds_type(f"instance-{thread_id}-{i}.xyz.us-east-2.rds.amazonaws.com")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(identify_rds_types, thread_id) for thread_id in range(8)]
+        for future in futures:
+            future.result()
+
+    assert len(HostMonitoringPlugin._rds_type_cache) <= 8
+
+
 @pytest.mark.parametrize(
     "host_events",
     [{"instance-1.xyz.us-east-2.rds.amazonaws.com": {HostEvent.HOST_DELETED}},
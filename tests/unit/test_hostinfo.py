@@ -54,3 +54,22 @@ def test_host_info_hash():
     assert not isinstance(host_info, Hashable)
     with pytest.raises(TypeError):
         hash(host_info)
+
+
+def test_host_info_aliases():
+    host_info = HostInfo("testhost", 1234)
+    all_aliases = host_info.all_aliases
+    assert all_aliases is host_info.all_aliases
+
+    host_info.add_alias("alias1", "alias2")
+    assert frozenset({"alias1", "alias2"}) == host_info.aliases
+    assert frozenset({"testhost:1234", "alias1", "alias2"}) == host_info.all_aliases
+    assert frozenset({"testhost:1234"}) == all_aliases
+
+    host_info.remove_alias("alias1")
+    assert frozenset({"alias2"}) == host_info.aliases
+    assert frozenset({"testhost:1234", "alias2"}) == host_info.all_aliases
+
+    host_info.reset_aliases()
+    assert 0 == len(host_info.aliases)
+    assert frozenset({"testhost:1234"}) == host_info.all_aliases
@@ -0,0 +1,106 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License").
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+
+from aws_advanced_python_wrapper.utils.log import Logger
+from aws_advanced_python_wrapper.utils.messages import Messages
+
+_LOGGER_NAME = "tests.unit.test_log"
+
+
+def test_log_formatted_message(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.debug("HostMonitoringPlugin.ActivatedMonitoring", "Cursor.execute")
+
+    assert 1 == len(caplog.records)
+    assert Messages.get_formatted("HostMonitoringPlugin.ActivatedMonitoring", "Cursor.execute") == \
+        caplog.records[0].getMessage()
+
+
+def test_log_message_without_args(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.warning("HostMonitoringPlugin.ClusterEndpointHostInfo")
+        logger.error("Not a message key")
+
+    assert 2 == len(caplog.records)
+    assert Messages.get("HostMonitoringPlugin.ClusterEndpointHostInfo") == caplog.records[0].getMessage()
+    assert "Not a message key" == caplog.records[1].getMessage()
+
+
+def test_log_defers_formatting(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.info("HostMonitoringPlugin.ActivatedMonitoring", "Cursor.execute")
+
+    record = caplog.records[0]
+    assert ("Cursor.execute",) == record.args
+    assert "%s" in record.msg
+
+
+def test_log_disabled_level(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.ERROR, logger=_LOGGER_NAME):
+        logger.debug("HostMonitoringPlugin.ActivatedMonitoring", "Cursor.execute")
+        logger.warning("HostMonitoringPlugin.ClusterEndpointHostInfo")
+
+    assert 0 == len(caplog.records)
+
+
+def test_is_enabled_for(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.INFO, logger=_LOGGER_NAME):
+        assert logger.is_enabled_for(logging.INFO)
+        assert not logger.is_enabled_for(logging.DEBUG)
+
+
+def test_log_ignores_extra_args(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.debug("HostMonitoringPlugin.ClusterEndpointHostInfo", "unused")
+
+    assert Messages.get("HostMonitoringPlugin.ClusterEndpointHostInfo") == caplog.records[0].getMessage()
+
+
+def test_log_ignores_extra_args_without_placeholders(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.debug("{{100% done}}", "unused")
+
+    assert "{100% done}" == caplog.records[0].getMessage()
+
+
+def test_log_non_string_message(caplog):
+    logger = Logger(_LOGGER_NAME)
+    error = ValueError("Some error")
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.debug(error)
+
+    assert "Some error" == caplog.records[0].getMessage()
+
+
+def test_log_unknown_key_with_args(caplog):
+    logger = Logger(_LOGGER_NAME)
+    with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+        logger.debug("{{{0}}} is at 100% after {1}", "cpu", "5s")
+
+    assert "{cpu} is at 100% after 5s" == caplog.records[0].getMessage()
+
+
+def test_logger_instance_per_name():
+    assert Logger(_LOGGER_NAME) is Logger(_LOGGER_NAME)
+    assert Logger(_LOGGER_NAME) is not Logger(_LOGGER_NAME + ".other")
+    assert logging.getLogger(_LOGGER_NAME) is Logger(_LOGGER_NAME).logger
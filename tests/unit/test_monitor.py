@@ -18,6 +18,7 @@ from time import perf_counter_ns, sleep
 import psycopg
 import pytest
 
+from aws_advanced_python_wrapper.errors import QueryTimeoutError
 from aws_advanced_python_wrapper.host_monitoring_plugin import (
     Monitor, MonitoringContext, MonitoringThreadContainer)
 from aws_advanced_python_wrapper.hostinfo import HostInfo
@@ -47,6 +48,7 @@ def monitoring_conn_props(props):
 def mock_monitoring_context(mocker):
     context = mocker.MagicMock()
     context.failure_detection_interval_ms = 500
+    context.active_monitoring_start_time_ns = perf_counter_ns()
     return context
 
 
@@ -91,6 +93,19 @@ def mock_aborted_connection_counter(mocker):
     return mocker.MagicMock()
 
 
+def test_get_monitoring_props():
+    props = Properties({
+        "some_prop": "value",
+        "monitoring-some_prop": "monitoring_value",
+        "monitoring-other_prop": "other_value",
+        WrapperProperties.CONNECT_TIMEOUT_SEC.name: 5})
+
+    assert Properties({
+        "some_prop": "monitoring_value",
+        "other_prop": "other_value",
+        WrapperProperties.CONNECT_TIMEOUT_SEC.name: 5}) == Monitor._get_monitoring_props(props)
+
+
 def test_start_monitoring(monitor, mock_monitoring_context):
     current_time = perf_counter_ns()
     assert 0 != monitor._context_last_used_ns
@@ -98,7 +113,18 @@ def test_start_monitoring(monitor, mock_monitoring_context):
     monitor.start_monitoring(mock_monitoring_context)
     mock_monitoring_context.set_monitor_start_time_ns.assert_called_once()
     assert monitor._context_last_used_ns > current_time
-    assert mock_monitoring_context == monitor._new_contexts.get_nowait()
+    assert mock_monitoring_context == monitor._new_contexts[0][2]
+
+
+def test_start_monitoring__orders_new_contexts(mocker, monitor):
+    late_context = mocker.MagicMock()
+    late_context.active_monitoring_start_time_ns = 2000
+    early_context = mocker.MagicMock()
+    early_context.active_monitoring_start_time_ns = 1000
+
+    monitor.start_monitoring(late_context)
+    monitor.start_monitoring(early_context)
+    assert early_context == monitor._new_contexts[0][2]
 
 
 def test_stop_monitoring(monitor, mock_monitoring_context):
@@ -113,17 +139,14 @@ def test_stop_monitoring(monitor, mock_monitoring_context):
     assert monitor._context_last_used_ns > current_time
 
 
-def test_clear_contexts(mocker, monitor):
-    mock_new_context = mocker.MagicMock()
+def test_clear_contexts(mocker, monitor, mock_monitoring_context):
     mock_active_context = mocker.MagicMock()
-    monitor._new_contexts.put(mock_new_context)
-    monitor._active_contexts.put(mock_active_context)
+    monitor.start_monitoring(mock_monitoring_context)
+    monitor._active_contexts.append(mock_active_context)
 
     monitor.clear_contexts()
-    assert monitor._new_contexts.empty()
-    assert monitor._active_contexts.empty()
-    assert 0 == monitor._new_contexts.unfinished_tasks
-    assert 0 == monitor._active_contexts.unfinished_tasks
+    assert 0 == len(monitor._new_contexts)
+    assert 0 == len(monitor._active_contexts)
 
 
 def test_run_host_available(
@@ -233,6 +256,99 @@ def test_run__no_contexts(mocker, monitor):
     MonitoringThreadContainer.clean_up()
 
 
+def test_run__stop_interrupts_sleep(mocker, monitor):
+    mocker.patch.object(Monitor, "_INACTIVE_SLEEP_MS", 60_000)
+    monitor._monitor_disposal_time_ms = 60_000
+
+    executor = ThreadPoolExecutor()
+    future = executor.submit(monitor.run)
+    sleep(0.1)  # Allow some time for the monitor to start sleeping
+
+    start_ns = perf_counter_ns()
+    monitor.stop()
+    wait([future], 3)
+    assert future.done()
+    assert (perf_counter_ns() - start_ns) < 3_000_000_000
+
+
+def test_run__idle_sleeps_until_new_context_due(mocker, monitor, mock_monitoring_context):
+    mocker.patch.object(Monitor, "_INACTIVE_SLEEP_MS", 100)
+    mock_monitoring_context.active_monitoring_start_time_ns = perf_counter_ns() + 50_000_000
+    mock_sleep = mocker.patch(
+        "aws_advanced_python_wrapper.host_monitoring_plugin.Monitor.sleep", side_effect=InterruptedError())
+    monitor.start_monitoring(mock_monitoring_context)
+
+    monitor.run()
+
+    assert mock_sleep.call_args.args[0] <= 0.05
+    assert mock_monitoring_context.active_monitoring_start_time_ns == monitor._idle_wakeup_time_ns
+
+
+def test_run__drops_stopped_new_contexts(mocker, monitor):
+    mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Monitor.sleep", side_effect=InterruptedError())
+    start_time_ns = perf_counter_ns() + 60_000_000_000
+    contexts = []
+    for _ in range(3):
+        context = mocker.MagicMock()
+        context.active_monitoring_start_time_ns = start_time_ns
+        context.is_active = True
+        monitor.start_monitoring(context)
+        contexts.append(context)
+
+    # A minority of stopped contexts stays in the heap until it is popped
+    monitor.stop_monitoring(contexts[0])
+    monitor.run()
+    assert contexts == [entry[2] for entry in monitor._new_contexts]
+
+    monitor.stop_monitoring(contexts[2])
+    monitor.run()
+    assert [contexts[1]] == [entry[2] for entry in monitor._new_contexts]
+    assert 0 == monitor._stopped_new_contexts
+
+
+def test_run__skips_stopped_due_contexts(mocker, monitor):
+    mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Monitor.sleep", side_effect=InterruptedError())
+    mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Monitor._check_host_status",
+                 side_effect=InterruptedError())
+    stopped_context = mocker.MagicMock()
+    stopped_context.active_monitoring_start_time_ns = 1
+    stopped_context.is_active = True
+    monitor.start_monitoring(stopped_context)
+    monitor.stop_monitoring(stopped_context)
+    assert 1 == monitor._stopped_new_contexts
+    active_context = mocker.MagicMock()
+    active_context.active_monitoring_start_time_ns = 1
+    active_context.is_active = True
+    monitor.start_monitoring(active_context)
+    monitor.start_monitoring(mocker.MagicMock(active_monitoring_start_time_ns=perf_counter_ns() + 60_000_000_000))
+
+    monitor.run()
+
+    assert [active_context] == list(monitor._active_contexts)
+    assert 0 == monitor._stopped_new_contexts
+
+
+def test_start_monitoring__wakes_idle_monitor(mocker, monitor):
+    monitor._idle_wakeup_time_ns = 2000
+    late_context = mocker.MagicMock()
+    late_context.active_monitoring_start_time_ns = 3000
+    early_context = mocker.MagicMock()
+    early_context.active_monitoring_start_time_ns = 1000
+
+    # The idle monitor wakes up before the late context is due anyway
+    monitor.start_monitoring(late_context)
+    assert not monitor._wakeup.is_set()
+
+    monitor.start_monitoring(early_context)
+    assert monitor._wakeup.is_set()
+
+
+def test_start_monitoring__does_not_wake_active_monitor(monitor, mock_monitoring_context):
+    monitor._idle_wakeup_time_ns = 0
+    monitor.start_monitoring(mock_monitoring_context)
+    assert not monitor._wakeup.is_set()
+
+
 def test_check_connection_status__valid_then_invalid(mocker, monitor):
     mock_execute_conn_check = mocker.patch(
         "aws_advanced_python_wrapper.host_monitoring_plugin.Monitor._execute_conn_check",
@@ -247,6 +363,43 @@ def test_check_connection_status__valid_then_invalid(mocker, monitor):
     assert 2 == mock_execute_conn_check.call_count
 
 
+def test_check_connection_status__query_timeout(mocker, monitor, mock_driver_dialect):
+    mock_driver_dialect.execute.side_effect = QueryTimeoutError()
+
+    status = monitor._check_host_status(30)  # Initiate a monitoring connection
+    assert status.is_available
+    status = monitor._check_host_status(30)
+    assert not status.is_available
+    mock_driver_dialect.execute.assert_called_once()
+
+
+def test_execute_conn_check__reuses_cursor(monitor, mock_conn, mock_driver_dialect):
+    monitor._execute_conn_check(mock_conn, 5)
+    monitor._execute_conn_check(mock_conn, 5)
+    mock_conn.cursor.assert_called_once()
+
+    mock_driver_dialect.execute.side_effect = QueryTimeoutError()
+    mock_conn.cursor.return_value.close.side_effect = Exception()
+    with pytest.raises(QueryTimeoutError):
+        monitor._execute_conn_check(mock_conn, 5)
+    mock_conn.cursor.return_value.close.assert_called_once()
+
+    mock_driver_dialect.execute.side_effect = None
+    monitor._execute_conn_check(mock_conn, 5)
+    assert 2 == mock_conn.cursor.call_count
+
+
+def test_check_connection_status__reconnect_closes_cursor(mocker, monitor, mock_driver_dialect):
+    mock_cursor = mocker.MagicMock()
+    monitor._monitoring_cursor = mock_cursor
+    mock_driver_dialect.is_closed.return_value = True
+
+    status = monitor._check_host_status(30)
+    assert status.is_available
+    mock_cursor.close.assert_called_once()
+    assert monitor._monitoring_cursor is None
+
+
 def test_check_connection_status__conn_check_throws_exception(mocker, monitor):
     mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Monitor._execute_conn_check",
                  side_effect=Exception())
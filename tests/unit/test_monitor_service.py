@@ -46,29 +46,26 @@ def mock_monitor(mocker):
 
 
 @pytest.fixture
-def mock_executor(mocker):
-    return mocker.MagicMock()
+def mock_thread_class(mocker):
+    return mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Thread")
 
 
 @pytest.fixture
-def thread_container(mock_executor):
-    container = MonitoringThreadContainer()
-    MonitoringThreadContainer._executor = mock_executor
-    return container
+def thread_container(mock_thread_class):
+    return MonitoringThreadContainer()
 
 
 @pytest.fixture
-def monitor_service_mocked_container(mock_plugin_service, mock_thread_container):
-    service = MonitorService(mock_plugin_service)
-    service._monitor_container = mock_thread_container
-    return service
+def monitor_service_mocked_container(mocker, mock_plugin_service, mock_thread_container):
+    mocker.patch(
+        "aws_advanced_python_wrapper.host_monitoring_plugin.MonitoringThreadContainer",
+        return_value=mock_thread_container)
+    return MonitorService(mock_plugin_service)
 
 
 @pytest.fixture
 def monitor_service_with_container(mock_plugin_service, thread_container):
-    service = MonitorService(mock_plugin_service)
-    service._monitor_container = thread_container
-    return service
+    return MonitorService(mock_plugin_service)
 
 
 @pytest.fixture(autouse=True)
@@ -99,7 +96,7 @@ def test_start_monitoring(
     assert aliases == monitor_service_mocked_container._cached_monitor_aliases
 
 
-def test_start_monitoring__multiple_calls(monitor_service_with_container, mock_monitor, mock_executor, mock_conn):
+def test_start_monitoring__multiple_calls(monitor_service_with_container, mock_monitor, mock_thread_class, mock_conn):
     aliases = frozenset({"instance-1"})
 
     num_calls = 5
@@ -108,11 +105,27 @@ def test_start_monitoring__multiple_calls(monitor_service_with_container, mock_m
             mock_conn, aliases, HostInfo("instance-1"), Properties(), 5000, 1000, 3)
 
     assert num_calls == mock_monitor.start_monitoring.call_count
-    mock_executor.submit.assert_called_once_with(mock_monitor.run)
+    mock_thread_class.assert_called_once_with(
+        target=mock_monitor.run, daemon=True, name=f"MonitoringThreadContainer-{mock_monitor._host_info.url}")
     assert mock_monitor == monitor_service_with_container._cached_monitor()
     assert aliases == monitor_service_with_container._cached_monitor_aliases
 
 
+def test_start_monitoring__after_clean_up(monitor_service_with_container, mock_monitor, mock_conn):
+    aliases = frozenset({"instance-1"})
+    monitor_service_with_container.start_monitoring(
+        mock_conn, aliases, HostInfo("instance-1"), Properties(), 5000, 1000, 3)
+
+    MonitoringThreadContainer.clean_up()
+    mock_monitor.stop.assert_called_once()
+    mock_monitor.is_stopped = True
+
+    monitor_service_with_container.start_monitoring(
+        mock_conn, aliases, HostInfo("instance-1"), Properties(), 5000, 1000, 3)
+    # The monitor is registered with the container replacing the one discarded by clean_up()
+    assert mock_monitor == MonitoringThreadContainer().get_monitor("instance-1")
+
+
 def test_start_monitoring__cached_monitor(
         monitor_service_mocked_container, mock_plugin_service, mock_monitor, mock_conn, mock_thread_container):
     aliases = frozenset({"instance-1"})
@@ -133,7 +133,7 @@ def test_update_connection_status_inactive_context(mocker, context, failure_time
     monitor_start_ns = status_check_start_ns - (failure_time_ms * 1_000_000)
     context._monitor_start_time_ns = monitor_start_ns
     context._is_active = False
-    spy = mocker.spy(context, "_set_host_availability")
+    spy = mocker.spy(MonitoringContext, "_set_host_availability")
 
     context.update_host_status("url", status_check_start_ns, status_check_end_ns, False)
     spy.assert_not_called()
@@ -144,7 +144,7 @@ def test_update_connection_status_before_failure_time(mocker, context, failure_t
     status_check_start_ns = status_check_end_ns - (failure_interval_ms * 1_000_000 / 4)
     monitor_start_ns = status_check_start_ns - (failure_time_ms * 1_000_000 / 2)
     context._monitor_start_time_ns = monitor_start_ns
-    spy = mocker.spy(context, "_set_host_availability")
+    spy = mocker.spy(MonitoringContext, "_set_host_availability")
 
     context.update_host_status("url", status_check_start_ns, status_check_end_ns, False)
     spy.assert_not_called()
@@ -20,20 +20,13 @@ from aws_advanced_python_wrapper.host_monitoring_plugin import \
 
 
 @pytest.fixture
-def container(mock_executor):
-    container = MonitoringThreadContainer()
-    MonitoringThreadContainer._executor = mock_executor
-    return container
+def container(mock_thread_class):
+    return MonitoringThreadContainer()
 
 
 @pytest.fixture
-def mock_executor(mocker):
-    return mocker.MagicMock()
-
-
-@pytest.fixture
-def mock_future(mocker):
-    return mocker.MagicMock()
+def mock_thread_class(mocker):
+    return mocker.patch("aws_advanced_python_wrapper.host_monitoring_plugin.Thread")
 
 
 @pytest.fixture
@@ -72,12 +65,14 @@ def release_container():
 
 
 def test_get_or_create_monitor__monitor_created(
-        container, mock_monitor_supplier, mock_stopped_monitor, mock_monitor1, mock_executor, mock_future):
+        container, mock_monitor_supplier, mock_stopped_monitor, mock_monitor1, mock_thread_class):
     result = container.get_or_create_monitor(frozenset({"alias-1", "alias-2"}), mock_monitor_supplier)
     assert mock_monitor1 == result
 
     mock_monitor_supplier.assert_called_once()
-    mock_executor.submit.assert_called_once_with(mock_monitor1.run)
+    mock_thread_class.assert_called_once_with(
+        target=mock_monitor1.run, daemon=True, name=f"MonitoringThreadContainer-{mock_monitor1._host_info.url}")
+    mock_thread_class.return_value.start.assert_called_once()
     assert mock_monitor1 == container._monitor_map.get("alias-1")
     assert mock_monitor1 == container._monitor_map.get("alias-2")
 
@@ -146,25 +141,23 @@ def test_get_or_create_monitor__null_monitor(container, mock_monitor_supplier):
 def test_release_monitor(mocker, mock_monitor1, mock_monitor2, container):
     container._monitor_map.put_if_absent("alias-1", mock_monitor1)
     container._monitor_map.put_if_absent("alias-2", mock_monitor2)
-    mock_future_1 = mocker.MagicMock()
-    mock_future_2 = mocker.MagicMock()
-    container._tasks_map.put_if_absent(mock_monitor1, mock_future_1)
-    container._tasks_map.put_if_absent(mock_monitor2, mock_future_2)
+    mock_thread_1 = mocker.MagicMock()
+    mock_thread_2 = mocker.MagicMock()
+    container._tasks_map.put_if_absent(mock_monitor1, mock_thread_1)
+    container._tasks_map.put_if_absent(mock_monitor2, mock_thread_2)
 
     container.release_monitor(mock_monitor2)
     assert container._monitor_map.get("alias-1")
     assert container._monitor_map.get("alias-2") is None
-    assert mock_future_1 == container._tasks_map.get(mock_monitor1)
+    assert mock_thread_1 == container._tasks_map.get(mock_monitor1)
     assert container._tasks_map.get(mock_monitor2) is None
-    mock_future_1.cancel.assert_not_called()
-    mock_future_2.cancel.assert_called_once()
+    mock_monitor1.stop.assert_not_called()
+    mock_monitor2.stop.assert_called_once()
 
 
-def test_release_instance(mocker, container, mock_monitor1, mock_future):
+def test_release_instance(mocker, container, mock_monitor1):
     container._monitor_map.put_if_absent("alias-1", mock_monitor1)
-    container._tasks_map.put_if_absent(mock_monitor1, mock_future)
-    mock_future.done.return_value = False
-    mock_future.cancelled.return_value = False
+    container._tasks_map.put_if_absent(mock_monitor1, mocker.MagicMock())
 
     container2 = MonitoringThreadContainer()
     assert container2 is container
@@ -173,5 +166,16 @@ def test_release_instance(mocker, container, mock_monitor1, mock_future):
 
     assert 0 == len(container._monitor_map)
     assert 0 == len(container._tasks_map)
-    mock_future.cancel.assert_called_once()
+    mock_monitor1.stop.assert_called_once()
     assert MonitoringThreadContainer._instance is None
+
+
+def test_new_instance_after_clean_up(container, mock_monitor1):
+    container._monitor_map.put_if_absent("alias-1", mock_monitor1)
+    MonitoringThreadContainer.clean_up()
+
+    new_container = MonitoringThreadContainer()
+    assert new_container is not container
+    assert new_container._monitor_map is not container._monitor_map
+    assert new_container._tasks_map is not container._tasks_map
+    assert new_container._monitor_map.get("alias-1") is None
@@ -38,21 +38,11 @@ def mock_monitor(mocker):
     return mocker.MagicMock()
 
 
-@pytest.fixture
-def mock_executor(mocker):
-    return mocker.MagicMock()
-
-
 @pytest.fixture
 def mock_plugin_service(mocker):
     return mocker.MagicMock()
 
 
-@pytest.fixture
-def mock_future(mocker):
-    return mocker.MagicMock()
-
-
 @pytest.fixture
 def failure_detection_time_ms():
     return 10
@@ -68,13 +58,6 @@ def failure_detection_count():
     return 3
 
 
-@pytest.fixture
-def thread_container(mock_executor):
-    MonitoringThreadContainer._executor = mock_executor
-    mock_executor.return_value = mock_future
-    return mock_executor
-
-
 @pytest.fixture
 def host_info():
     return HostInfo("localhost")
@@ -101,9 +84,7 @@ def mock_aborted_connection_counter(mocker):
 
 
 @pytest.fixture(autouse=True)
-def verify_concurrency(mock_monitor, mock_executor, mock_future, counter, concurrent_counter):
-    # The ThreadPoolExecutor may have been shut down by a previous test, so we'll need to recreate it here.
-    MonitoringThreadContainer._executor = ThreadPoolExecutor(thread_name_prefix="MonitoringThreadContainerExecutor")
+def verify_concurrency(mock_monitor, counter, concurrent_counter):
     yield
 
     counter.set(0)
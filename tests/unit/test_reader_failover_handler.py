@@ -24,12 +24,15 @@ if TYPE_CHECKING:
     from aws_advanced_python_wrapper.failover_result import ReaderFailoverResult
     from aws_advanced_python_wrapper.pep249 import Connection
 
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
 from time import sleep, time
 
 from aws_advanced_python_wrapper.host_availability import HostAvailability
 from aws_advanced_python_wrapper.hostinfo import HostInfo, HostRole
 from aws_advanced_python_wrapper.reader_failover_handler import (
     ReaderFailoverHandler, ReaderFailoverHandlerImpl)
+from aws_advanced_python_wrapper.utils.atomic import AtomicInt
 from aws_advanced_python_wrapper.utils.properties import Properties
 
 
@@ -63,6 +66,21 @@ def set_available_count_for_host():
     return 0
 
 
+@pytest.fixture
+def slow_attempts_released():
+    return Event()
+
+
+@pytest.fixture(autouse=True)
+def wait_for_attempts(mocker, slow_attempts_released):
+    handler_init_spy = mocker.spy(ReaderFailoverHandlerImpl, "__init__")
+    yield
+    # Release the slow connection attempts and wait for them, so that no attempt outlives the test
+    slow_attempts_released.set()
+    for init_call in handler_init_spy.call_args_list:
+        init_call.args[0]._executor.shutdown(wait=True)
+
+
 def test_failover(plugin_service_mock, connection_mock, default_properties, default_hosts):
     hosts = default_hosts.copy()
     props = default_properties
@@ -73,8 +91,8 @@ def test_failover(plugin_service_mock, connection_mock, default_properties, defa
                 else call(x.all_aliases, HostAvailability.AVAILABLE)
                 for x in hosts]
 
-    # current host should be called twice
-    expected.append(call(current_host.all_aliases, HostAvailability.UNAVAILABLE))
+    # The current host and the success host are both down, so they are tried last in random order. Only the call
+    # marking the current host unavailable before the failover starts is certain.
     exception = Exception("Test Exception")
 
     def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
@@ -89,7 +107,8 @@ def test_failover(plugin_service_mock, connection_mock, default_properties, defa
     hosts[2]._availability = HostAvailability.UNAVAILABLE
     hosts[4]._availability = HostAvailability.UNAVAILABLE
 
-    target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(plugin_service_mock, props)
+    # Attempt one host at a time so that every host before the success host is tried to completion
+    target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(plugin_service_mock, props, max_parallel_attempts=1)
     result: ReaderFailoverResult = target.failover(hosts, current_host)
 
     # Confirm we got a successful connection with the expected host
@@ -100,6 +119,66 @@ def test_failover(plugin_service_mock, connection_mock, default_properties, defa
     plugin_service_mock.set_availability.assert_has_calls(expected, any_order=True)
 
 
+def test_failover_retries_after_failed_round(
+        mocker, plugin_service_mock, connection_mock, default_properties, default_hosts):
+    hosts = default_hosts[0:3]
+    attempts = AtomicInt()
+    get_hosts_by_priority_spy = mocker.spy(ReaderFailoverHandlerImpl, "get_hosts_by_priority")
+
+    def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
+        # Every host fails during the first round
+        if attempts.increment_and_get() <= len(hosts):
+            raise Exception("Test Exception")
+        return connection_mock
+
+    plugin_service_mock.force_connect.side_effect = force_connect_side_effect
+    plugin_service_mock.is_network_exception.return_value = True
+
+    target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(plugin_service_mock, default_properties)
+    result: ReaderFailoverResult = target.failover(hosts, None)
+
+    assert result.is_connected
+    assert result.connection == connection_mock
+    assert attempts.get() > len(hosts)
+    get_hosts_by_priority_spy.assert_called_once()
+
+
+def test_concurrent_failovers(plugin_service_mock, connection_mock, default_properties, default_hosts):
+    num_failovers = 40
+
+    def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
+        sleep(1)
+        return connection_mock
+
+    plugin_service_mock.force_connect.side_effect = force_connect_side_effect
+
+    def failover() -> ReaderFailoverResult:
+        target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(
+            plugin_service_mock, default_properties, max_timeout_sec=3, timeout_sec=3)
+        return target.failover(default_hosts, default_hosts[1])
+
+    # Concurrent failovers must not wait for each other's connection attempts
+    with ThreadPoolExecutor(max_workers=num_failovers) as executor:
+        futures = [executor.submit(failover) for _ in range(num_failovers)]
+        results = [future.result() for future in futures]
+
+    assert all(result.is_connected for result in results)
+
+
+def test_failovers_reuse_executor(plugin_service_mock, connection_mock, default_properties, default_hosts):
+    plugin_service_mock.force_connect.return_value = connection_mock
+    target = ReaderFailoverHandlerImpl(plugin_service_mock, default_properties)
+    executor = target._executor
+
+    assert target.failover(default_hosts, None).is_connected
+    assert target.failover(default_hosts, None).is_connected
+    assert executor is target._executor
+
+    target.close()
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
 def test_failover_timeout(plugin_service_mock, connection_mock, default_properties, default_hosts):
     hosts = default_hosts
     props = default_properties
@@ -152,7 +231,8 @@ def test_failover_null_or_empty_host_list(plugin_service_mock, connection_mock,
     assert result.new_host is None
 
 
-def test_get_reader_connection_success(plugin_service_mock, connection_mock, default_properties, default_hosts):
+def test_get_reader_connection_success(
+        plugin_service_mock, connection_mock, default_properties, default_hosts, slow_attempts_released):
     hosts = default_hosts[0:3]
     props = default_properties
     slow_host = hosts[1]
@@ -161,7 +241,7 @@ def test_get_reader_connection_success(plugin_service_mock, connection_mock, def
     def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
         # we want slow host to take 20 seconds before returning connection
         if host_info == slow_host:
-            sleep(20)
+            slow_attempts_released.wait(20)
         return connection_mock
 
     plugin_service_mock.force_connect.side_effect = force_connect_side_effect
@@ -177,6 +257,59 @@ def test_get_reader_connection_success(plugin_service_mock, connection_mock, def
     plugin_service_mock.set_availability.assert_any_call(fast_host.all_aliases, HostAvailability.AVAILABLE)
 
 
+def test_get_reader_connection_closes_unused_connection(mocker, plugin_service_mock, connection_mock, default_properties,
+                                                        default_hosts):
+    hosts = default_hosts[0:3]
+    slow_host = hosts[1]
+    slow_connection_mock = mocker.MagicMock(spec=psycopg.Connection)
+    slow_host_connected = Event()
+
+    def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
+        if host_info == slow_host:
+            sleep(0.5)
+            slow_host_connected.set()
+            return slow_connection_mock
+        return connection_mock
+
+    plugin_service_mock.force_connect.side_effect = force_connect_side_effect
+
+    target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(plugin_service_mock, default_properties)
+    result: ReaderFailoverResult = target.get_reader_connection(hosts)
+
+    assert result.connection == connection_mock
+    assert slow_host_connected.wait(5)
+    sleep(0.1)  # Allow some time for the unused connection to be closed
+    slow_connection_mock.close.assert_called_once()
+    connection_mock.close.assert_not_called()
+
+
+def test_get_reader_connection_limits_parallel_attempts(plugin_service_mock, connection_mock, default_properties,
+                                                        default_hosts):
+    hosts = default_hosts[1:]
+    success_host = hosts[-1]
+    in_progress = AtomicInt()
+    in_progress_counts = []
+
+    def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
+        in_progress_counts.append(in_progress.increment_and_get())
+        sleep(0.1)
+        in_progress.decrement_and_get()
+        if host_info == success_host:
+            return connection_mock
+        raise Exception("Test Exception")
+
+    plugin_service_mock.force_connect.side_effect = force_connect_side_effect
+    plugin_service_mock.is_network_exception.return_value = True
+
+    target: ReaderFailoverHandler = ReaderFailoverHandlerImpl(plugin_service_mock, default_properties,
+                                                              max_parallel_attempts=2)
+    result: ReaderFailoverResult = target.get_reader_connection(hosts)
+
+    assert result.is_connected
+    assert result.new_host == success_host
+    assert 2 == max(in_progress_counts)
+
+
 def test_get_reader_connection_failure(plugin_service_mock, connection_mock, default_properties, default_hosts):
     hosts = default_hosts[0:4]
     props = default_properties
@@ -197,15 +330,12 @@ def test_get_reader_connection_failure(plugin_service_mock, connection_mock, def
 
 
 def test_get_reader_connection_attempts_timeout(plugin_service_mock, connection_mock, default_properties,
-                                                default_hosts):
+                                                default_hosts, slow_attempts_released):
     hosts = default_hosts[0:3]
     props = default_properties
 
     def force_connect_side_effect(host_info, properties, timeout_event) -> Connection:
-        try:
-            sleep(5)
-        except Exception:
-            pass
+        slow_attempts_released.wait(5)
         return connection_mock
 
     plugin_service_mock.force_connect.side_effect = force_connect_side_effect
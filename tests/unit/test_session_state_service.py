@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from aws_advanced_python_wrapper import AwsWrapperConnection
@@ -21,6 +23,7 @@ from aws_advanced_python_wrapper.driver_dialect import DriverDialect
 from aws_advanced_python_wrapper.plugin_service import PluginService
 from aws_advanced_python_wrapper.states.session_state_service import \
     SessionStateServiceImpl
+from aws_advanced_python_wrapper.utils.messages import Messages
 from aws_advanced_python_wrapper.utils.properties import Properties
 
 
@@ -121,3 +124,13 @@ def test_transfer_to_new_connection_autocommit(mock_connection, mock_new_connect
     session_state_service.complete()
 
     mock_plugin_service.driver_dialect.set_autocommit.assert_called_with(mock_new_connection, value)
+
+
+def test_log_current_state(session_state_service, caplog):
+    session_state_service._session_state.auto_commit.value = False
+    with caplog.at_level(logging.DEBUG, logger="aws_advanced_python_wrapper.states.session_state_service"):
+        session_state_service.log_current_state()
+
+    assert 1 == len(caplog.records)
+    assert Messages.get_formatted("SessionStateServiceImpl.CurrentSessionState", session_state_service._session_state) \
+        == caplog.records[0].getMessage()